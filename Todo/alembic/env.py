@@ -30,8 +30,9 @@ if config.config_file_name is not None:
 # Set target metadata for autogenerate
 target_metadata = SQLModel.metadata
 
-# Override sqlalchemy.url with DATABASE_URL from settings
-config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+# Override sqlalchemy.url with the direct (non-PgBouncer) URL from settings;
+# DDL needs session-level state that transaction pooling does not preserve
+config.set_main_option("sqlalchemy.url", settings.database_url_direct)
 
 
 def run_migrations_offline() -> None:
@@ -0,0 +1,31 @@
+"""tasks (user_id, id) index
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15 09:00:00
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Replace the redundant ix_tasks_id (the primary key is already a unique
+    btree) with a composite (user_id, id) index for user-scoped task lookups.
+    """
+    op.drop_index('ix_tasks_id', table_name='tasks')
+    op.create_index('ix_tasks_user_id_id', 'tasks', ['user_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """
+    Restore ix_tasks_id and drop the composite index.
+    """
+    op.drop_index('ix_tasks_user_id_id', table_name='tasks')
+    op.create_index('ix_tasks_id', 'tasks', ['id'], unique=False)
@@ -0,0 +1,35 @@
+"""tasks (user_id, created_at DESC, id DESC) index
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15 09:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Create the index backing keyset pagination of a user's task list
+    (ORDER BY created_at DESC, id DESC).
+    """
+    op.create_index(
+        'ix_tasks_user_id_created_at_id',
+        'tasks',
+        ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """
+    Drop the keyset pagination index.
+    """
+    op.drop_index('ix_tasks_user_id_created_at_id', table_name='tasks')
@@ -0,0 +1,30 @@
+"""drop redundant ix_tasks_user_id
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15 10:00:00
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Drop ix_tasks_user_id: ix_tasks_user_id_created_at_id (and
+    ix_tasks_user_id_id) lead with user_id and already serve those lookups,
+    so the single-column index only adds write and storage cost.
+    """
+    op.drop_index('ix_tasks_user_id', table_name='tasks')
+
+
+def downgrade() -> None:
+    """
+    Restore ix_tasks_user_id.
+    """
+    op.create_index('ix_tasks_user_id', 'tasks', ['user_id'], unique=False)
@@ -1,8 +1,9 @@
 """
 Application configuration and environment variable management.
 """
-from pydantic_settings import BaseSettings
-from typing import List
+from functools import cached_property
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -11,12 +12,23 @@ class Settings(BaseSettings):
     """
     # Database
     DATABASE_URL: str
+    # Neon PgBouncer endpoint (host suffix "-pooler") used by the app at runtime
+    DATABASE_URL_POOLED: Optional[str] = None
+    # Direct (unpooled) endpoint used by Alembic for DDL
+    DATABASE_URL_DIRECT: Optional[str] = None
+    # Serve read-only task queries over Neon's SQL-over-HTTP endpoint
+    NEON_HTTP_ENABLED: bool = False
+    # Override for the HTTP endpoint (defaults to https://<database host>/sql)
+    NEON_HTTP_ENDPOINT: Optional[str] = None
 
     # JWT Authentication
     BETTER_AUTH_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRE_MINUTES: int = 60
 
+    # Password hashing (bcrypt work factor; lowered in the test suite)
+    BCRYPT_ROUNDS: int = 12
+
     # CORS
     CORS_ORIGINS: str = "http://localhost:3000"
 
@@ -24,13 +36,22 @@ class Settings(BaseSettings):
     ENVIRONMENT: str = "development"
 
     @property
+    def database_url_pooled(self) -> str:
+        """Runtime database URL, preferring the PgBouncer-pooled endpoint."""
+        return self.DATABASE_URL_POOLED or self.DATABASE_URL
+
+    @property
+    def database_url_direct(self) -> str:
+        """Direct database URL for migrations (PgBouncer cannot run DDL safely)."""
+        return self.DATABASE_URL_DIRECT or self.DATABASE_URL
+
+    @cached_property
     def cors_origins_list(self) -> List[str]:
-        """Parse CORS origins from comma-separated string."""
+        """Parse CORS origins from comma-separated string (once per settings instance)."""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    # Frozen: settings are immutable (and hashable) after load
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, frozen=True)
 
 
 # Global settings instance
@@ -1,23 +1,61 @@
 """
 Database connection and session management for Neon Serverless PostgreSQL.
 """
-from sqlmodel import Session, create_engine
-from sqlalchemy.pool import NullPool
+from uuid import uuid4
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 from .config import settings
 
-# Create SQLModel engine with connection pooling for Neon
-# NullPool is recommended for serverless environments to avoid connection exhaustion
-engine = create_engine(
-    settings.DATABASE_URL,
+
+def _async_database_url(url: str) -> str:
+    """
+    Map a sync database URL onto its asyncio driver.
+    postgresql:// -> postgresql+asyncpg://, sqlite:// -> sqlite+aiosqlite://
+    """
+    if url.startswith("postgresql://"):
+        url = url.replace("postgresql://", "postgresql+asyncpg://", 1)
+        # asyncpg takes "ssl" instead of libpq's "sslmode"
+        url = url.replace("sslmode=", "ssl=")
+    elif url.startswith("sqlite://"):
+        url = url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return url
+
+
+def _engine_options(url: str) -> dict:
+    """
+    Pool settings for the runtime engine.
+    Neon's PgBouncer endpoint runs in transaction mode, so server-side
+    prepared statements must not outlive a transaction.
+    """
+    if not url.startswith("postgresql+asyncpg://"):
+        return {}
+
+    return {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_recycle": 300,
+        "connect_args": {
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        },
+    }
+
+
+DATABASE_URL = _async_database_url(settings.database_url_pooled)
+
+# Create async engine against Neon's PgBouncer-pooled endpoint (asyncpg driver)
+engine = create_async_engine(
+    DATABASE_URL,
     echo=settings.ENVIRONMENT == "development",
-    poolclass=NullPool if settings.ENVIRONMENT == "production" else None,
+    pool_pre_ping=True,
+    **_engine_options(DATABASE_URL),
 )
 
 
-def get_session():
+async def get_session():
     """
-    Dependency function to get database session.
+    Dependency function to get an async database session.
     Yields a session and ensures it's closed after use.
     """
-    with Session(engine) as session:
+    async with AsyncSession(engine, expire_on_commit=False) as session:
         yield session
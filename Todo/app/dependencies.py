@@ -2,86 +2,228 @@
 Dependency injection functions for FastAPI routes.
 Includes JWT token verification and user authentication.
 """
-from fastapi import Depends, HTTPException, status
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import time
+import jwt
+from jwt.exceptions import InvalidSubjectError
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
-from sqlmodel import Session, select
-from typing import Optional
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+from uuid import UUID
 from .config import settings
 from .database import get_session
+from .models.user import User
 
 # HTTP Bearer token security scheme
 security = HTTPBearer()
 
+# JWT verification parameters, resolved once at import
+_JWT_KEY = settings.BETTER_AUTH_SECRET.encode()
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+_JWT_OPTIONS = {"require": ["sub", "exp"]}
+
+# Keyed HMAC state for HS* tokens; each verification copies it instead of
+# re-running the key schedule (None for non-HMAC algorithms)
+_HMAC_DIGESTS = {"HS256": "sha256", "HS384": "sha384", "HS512": "sha512"}
+_HMAC_BASE = (
+    hmac.new(_JWT_KEY, digestmod=_HMAC_DIGESTS[settings.JWT_ALGORITHM])
+    if settings.JWT_ALGORITHM in _HMAC_DIGESTS
+    else None
+)
+
+
+class AuthUser(NamedTuple):
+    """Authenticated user resolved from a bearer token."""
+    id: UUID
+    email: str
+
+
+# Resolved users keyed on a digest of the raw bearer token, so repeat
+# requests with the same token skip jwt.decode and the users lookup.
+# Entries never outlive the token itself (see expiry check below).
+token_cache: "TTLCache[bytes, Tuple[AuthUser, float]]" = TTLCache(
+    maxsize=10_000,
+    ttl=min(60, settings.JWT_EXPIRE_MINUTES * 60),
+)
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Fixed-size cache key for a bearer token."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def invalidate_token(token: str) -> None:
+    """
+    Drop a token from the auth cache (e.g. on signout).
+
+    Args:
+        token: Raw JWT token string
+    """
+    token_cache.pop(_token_cache_key(token), None)
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """Decode an unpadded base64url JWT segment."""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _decode_hmac_token(token: str) -> Dict[str, Any]:
+    """
+    Verify an HS256/384/512 token against the cached HMAC key state.
+
+    Returns:
+        Decoded payload
+
+    Raises:
+        jwt.InvalidTokenError: If the token is malformed, the signature does
+            not match, sub/exp are missing, sub is not a string, exp has
+            passed, nbf is still in the future or iat is not a number
+    """
+    try:
+        header_b64, payload_b64, signature_b64 = token.split(".")
+        header = json.loads(_b64url_decode(header_b64))
+        signature = _b64url_decode(signature_b64)
+    except (ValueError, binascii.Error) as exc:
+        raise jwt.DecodeError("Malformed token") from exc
+
+    if not isinstance(header, dict) or header.get("alg") != settings.JWT_ALGORITHM:
+        raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+
+    mac = _HMAC_BASE.copy()
+    mac.update(f"{header_b64}.{payload_b64}".encode())
+    if not hmac.compare_digest(mac.digest(), signature):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+
+    try:
+        payload = json.loads(_b64url_decode(payload_b64))
+    except (ValueError, binascii.Error) as exc:
+        raise jwt.DecodeError("Invalid payload") from exc
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid payload")
+
+    for claim in _JWT_OPTIONS["require"]:
+        if claim not in payload:
+            raise jwt.MissingRequiredClaimError(claim)
+    if not isinstance(payload["sub"], str):
+        raise InvalidSubjectError("Subject must be a string")
+    now = time.time()
+    try:
+        expires_at = float(payload["exp"])
+    except (TypeError, ValueError) as exc:
+        raise jwt.DecodeError("Expiration Time claim (exp) must be a number") from exc
+    if expires_at <= now:
+        raise jwt.ExpiredSignatureError("Signature has expired")
+
+    # nbf and iat are validated as PyJWT does when present
+    if "nbf" in payload:
+        try:
+            not_before = float(payload["nbf"])
+        except (TypeError, ValueError) as exc:
+            raise jwt.DecodeError("Not Before claim (nbf) must be a number") from exc
+        if not_before > now:
+            raise jwt.ImmatureSignatureError("The token is not yet valid (nbf)")
+    if "iat" in payload:
+        try:
+            float(payload["iat"])
+        except (TypeError, ValueError) as exc:
+            raise jwt.InvalidIssuedAtError("Issued At claim (iat) must be a number") from exc
+
+    return payload
+
+
+async def _decode_token(token: str) -> Dict[str, Any]:
+    """
+    Verify and decode a JWT. HMAC tokens are checked inline with the
+    cached key state; other algorithms go through PyJWT off the event loop.
+    """
+    if _HMAC_BASE is not None:
+        return _decode_hmac_token(token)
+
+    return await run_in_threadpool(
+        jwt.decode,
+        token,
+        _JWT_KEY,
+        algorithms=_JWT_ALGORITHMS,
+        options=_JWT_OPTIONS,
+    )
+
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """
     Dependency function to verify JWT token and extract current user.
+    The resolved user is kept on request.state, so any later resolution
+    within the same request returns it without re-verifying the token.
 
     Args:
+        request: Incoming request (holds the per-request user)
         credentials: HTTPAuthorizationCredentials from Authorization header
         session: Database session
 
     Returns:
-        User object if token is valid
+        AuthUser (id, email) if token is valid
 
     Raises:
         HTTPException 401: If token is invalid, expired, or user not found
     """
+    current_user: Optional[AuthUser] = getattr(request.state, "current_user", None)
+    if current_user is not None:
+        return current_user
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    try:
-        # Extract token from credentials
-        token = credentials.credentials
+    # Extract token from credentials
+    token = credentials.credentials
+
+    cache_key = _token_cache_key(token)
+    cached = token_cache.get(cache_key)
+    if cached is not None:
+        auth_user, expires_at = cached
+        if time.time() < expires_at:
+            request.state.current_user = auth_user
+            return auth_user
+        token_cache.pop(cache_key, None)
 
+    try:
         # Decode JWT token
-        payload = jwt.decode(
-            token,
-            settings.BETTER_AUTH_SECRET,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = await _decode_token(token)
 
         # Extract user_id from token payload
-        user_id: str = payload.get("sub")
-        if user_id is None:
+        subject: Optional[str] = payload.get("sub")
+        if subject is None:
             raise credentials_exception
 
-    except JWTError:
-        raise credentials_exception
-
-    # Import User model here to avoid circular imports
-    from .models.user import User
-
-    # Fetch user from database
-    statement = select(User).where(User.id == user_id)
-    user = session.exec(statement).first()
+        user_id = UUID(subject)
+        expires_at = float(payload["exp"])
 
-    if user is None:
+    except (jwt.InvalidTokenError, ValueError):
         raise credentials_exception
 
-    return user
+    # Fetch only the columns callers need (skips password_hash and created_at)
+    statement = select(User.id, User.email).where(User.id == user_id)
+    row = (await session.exec(statement)).first()
 
+    if row is None:
+        raise credentials_exception
 
-def verify_user_ownership(current_user_id: str, resource_user_id: str) -> None:
-    """
-    Verify that the current user owns the resource.
+    auth_user = AuthUser(*row)
+    token_cache[cache_key] = (auth_user, expires_at)
+    request.state.current_user = auth_user
 
-    Args:
-        current_user_id: ID of the authenticated user
-        resource_user_id: ID of the user who owns the resource
+    return auth_user
 
-    Raises:
-        HTTPException 403: If user does not own the resource
-    """
-    if str(current_user_id) != str(resource_user_id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You do not have permission to access this resource"
-        )
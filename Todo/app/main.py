@@ -1,9 +1,50 @@
 """
 FastAPI application entry point with CORS middleware and router registration.
 """
+import logging
+import time
+from contextlib import asynccontextmanager
+import jwt
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
 from .config import settings
+from .database import engine
+from .dependencies import _decode_token
+from . import neon_http
+from .routers import auth, tasks
+
+logger = logging.getLogger(__name__)
+
+
+async def warmup() -> None:
+    """
+    Open the first pooled database connection and exercise the JWT path
+    at startup, so the first request doesn't pay for Neon's cold start.
+    """
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    except Exception:
+        logger.warning("Database warmup failed", exc_info=True)
+
+    token = jwt.encode(
+        {"sub": "warmup", "exp": int(time.time()) + 60},
+        settings.BETTER_AUTH_SECRET,
+        algorithm=settings.JWT_ALGORITHM,
+    )
+    await _decode_token(token)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks."""
+    await warmup()
+    yield
+    await neon_http.aclose()
+
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -12,6 +53,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Configure CORS middleware
@@ -21,8 +64,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+# Compress larger JSON responses (e.g. task lists); small bodies are sent as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 @app.get("/", tags=["Health"])
 async def root():
@@ -45,7 +92,5 @@ async def health_check():
 
 
 # Router registration
-from .routers import auth, tasks
-
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(tasks.router, tags=["Tasks"])
@@ -3,10 +3,12 @@ Task SQLModel for database table.
 Represents user-specific tasks with title, description, and status.
 """
 
+from sqlalchemy import Index, text
 from sqlmodel import SQLModel, Field, Relationship
 from uuid import UUID, uuid4
 from datetime import datetime
 from typing import Optional
+from .timestamps import utcnow
 
 
 class Task(SQLModel, table=True):
@@ -15,14 +17,31 @@ class Task(SQLModel, table=True):
     Each task belongs to exactly one user (enforced by foreign key).
     """
     __tablename__ = "tasks"
+    # Both composites lead with user_id, so they also serve plain user_id
+    # filters (and the foreign key) without a separate single-column index
+    __table_args__ = (
+        # Serves user-scoped lookups ("task id X owned by user Y")
+        Index("ix_tasks_user_id_id", "user_id", "id"),
+        # Serves the keyset-paginated task list (newest first)
+        Index("ix_tasks_user_id_created_at_id", "user_id", text("created_at DESC"), text("id DESC")),
+    )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
-    user_id: UUID = Field(foreign_key="users.id", index=True, nullable=False)
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    user_id: UUID = Field(foreign_key="users.id", nullable=False)
     title: str = Field(min_length=1, max_length=255, nullable=False)
     description: Optional[str] = Field(default=None, max_length=2000)
     status: str = Field(default="pending", max_length=50)
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
-    updated_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    # Timestamps are generated by the database, matching the migration DDL
+    created_at: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": utcnow()}
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": utcnow(), "onupdate": utcnow()}
+    )
 
     # Relationship to User (optional, for ORM navigation)
     # user: Optional["User"] = Relationship(back_populates="tasks")
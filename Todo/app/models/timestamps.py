@@ -0,0 +1,29 @@
+"""
+Server-side timestamp default shared by the table models.
+"""
+from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+
+
+class utcnow(FunctionElement):
+    """Database-generated current timestamp."""
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    """Postgres (and other server databases): CURRENT_TIMESTAMP, as in the migration DDL."""
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "sqlite")
+def _sqlite_utcnow(element, compiler, **kw):
+    """
+    SQLite's CURRENT_TIMESTAMP has whole-second precision and a shorter text
+    form than SQLAlchemy's storage format, so stored values would compare
+    wrongly against bound datetimes (e.g. keyset cursors). Emit microsecond
+    precision in the storage format instead.
+    """
+    return "(STRFTIME('%Y-%m-%d %H:%M:%f000', 'now'))"
@@ -6,6 +6,7 @@ from sqlmodel import SQLModel, Field
 from datetime import datetime
 from uuid import UUID, uuid4
 from typing import Optional
+from .timestamps import utcnow
 
 
 class User(SQLModel, table=True):
@@ -35,9 +36,10 @@ class User(SQLModel, table=True):
         max_length=255
     )
 
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        nullable=False
+    created_at: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": utcnow()}
     )
 
     # Note: tasks relationship will be added in Phase 3 (User Story 2)
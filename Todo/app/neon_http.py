@@ -0,0 +1,86 @@
+"""
+Neon serverless HTTP query client for one-shot, read-only queries.
+Each query is a single HTTPS request to Neon's SQL-over-HTTP endpoint,
+so it skips the TCP + TLS + Postgres startup handshake of a pooled connection.
+"""
+from typing import Any, Dict, List, Optional, Sequence
+from urllib.parse import urlsplit
+
+import httpx
+import orjson
+
+from .config import settings
+
+
+class NeonHTTPError(Exception):
+    """Raised when a query over the Neon HTTP endpoint fails."""
+
+
+# Shared client (keeps the HTTPS connection to Neon alive between queries)
+_client: Optional[httpx.AsyncClient] = None
+
+
+def is_enabled() -> bool:
+    """Whether read-only queries should be sent over Neon's HTTP endpoint."""
+    return settings.NEON_HTTP_ENABLED and settings.DATABASE_URL.startswith("postgres")
+
+
+def _sql_endpoint() -> str:
+    """SQL-over-HTTP endpoint, defaulting to https://<database host>/sql."""
+    if settings.NEON_HTTP_ENDPOINT:
+        return settings.NEON_HTTP_ENDPOINT
+    return f"https://{urlsplit(settings.DATABASE_URL).hostname}/sql"
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            headers={
+                "Neon-Connection-String": settings.DATABASE_URL,
+                "Neon-Raw-Text-Output": "true",
+                "Neon-Array-Mode": "false",
+            },
+            timeout=httpx.Timeout(5.0),
+        )
+    return _client
+
+
+async def query(sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Optional[str]]]:
+    """
+    Run a single parameterized query over HTTP.
+
+    Args:
+        sql: SQL text using $1, $2, ... placeholders
+        params: Positional parameter values (sent as text)
+
+    Returns:
+        List of rows as column-name -> text value dicts
+
+    Raises:
+        NeonHTTPError: If the request fails or Neon reports an error
+    """
+    payload = {
+        "query": sql,
+        "params": [None if value is None else str(value) for value in params],
+    }
+
+    try:
+        response = await _get_client().post(
+            _sql_endpoint(),
+            content=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)["rows"]
+    except (httpx.HTTPError, KeyError, orjson.JSONDecodeError) as exc:
+        raise NeonHTTPError(f"Neon HTTP query failed: {exc}") from exc
+
+
+async def aclose() -> None:
+    """Close the shared HTTP client (called on application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
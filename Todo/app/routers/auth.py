@@ -2,8 +2,12 @@
 Authentication router with signup and signin endpoints.
 """
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from contextlib import contextmanager
+from uuid import uuid4
 
 from ..database import engine, get_session
 from ..models.user import User
@@ -13,6 +17,12 @@ from ..services import auth_service
 
 router = APIRouter()
 
+# Dialect-specific INSERT constructs supporting ON CONFLICT
+_upsert_insert = {
+    "postgresql": pg_insert,
+    "sqlite": sqlite_insert,
+}
+
 
 @router.post(
     "/signup",
@@ -35,9 +45,9 @@ router = APIRouter()
     summary="Register a new user",
     description="Create a new user account with email and password. Returns JWT token for immediate authentication."
 )
-def signup(
+async def signup(
     request: SignupRequest,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """
     Register a new user account.
@@ -47,11 +57,22 @@ def signup(
 
     Returns JWT token for immediate authentication after signup.
     """
-    # Check if email already exists
-    statement = select(User).where(User.email == request.email)
-    existing_user = session.exec(statement).first()
+    # Hash password (bcrypt is CPU-bound, keep it off the event loop)
+    password_hash = await auth_service.hash_password_async(request.password)
+
+    # Create new user in a single round-trip; the unique email index
+    # rejects duplicates atomically, in which case nothing is returned
+    insert = _upsert_insert[session.bind.dialect.name]
+    statement = (
+        insert(User)
+        .values(id=uuid4(), email=request.email, password_hash=password_hash)
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(User.id)
+    )
+    new_user_id = (await session.exec(statement)).scalar_one_or_none()
+    await session.commit()
 
-    if existing_user:
+    if new_user_id is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
@@ -61,26 +82,12 @@ def signup(
             }
         )
 
-    # Hash password
-    password_hash = auth_service.hash_password(request.password)
-
-    # Create new user
-    new_user = User(
-        email=request.email,
-        password_hash=password_hash
-    )
-
-    # Save to database
-    session.add(new_user)
-    session.commit()
-    session.refresh(new_user)
-
     # Generate JWT token
-    token = auth_service.create_jwt_token(new_user.id, new_user.email)
+    token = auth_service.create_jwt_token(new_user_id, request.email)
 
     return TokenResponse(
-        user_id=str(new_user.id),
-        email=new_user.email,
+        user_id=str(new_user_id),
+        email=request.email,
         token=token
     )
 
@@ -106,9 +113,9 @@ def signup(
     summary="Sign in existing user",
     description="Authenticate with email and password. Returns JWT token on success."
 )
-def signin(
+async def signin(
     request: SigninRequest,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """
     Sign in an existing user.
@@ -120,10 +127,10 @@ def signin(
     """
     # Find user by email
     statement = select(User).where(User.email == request.email)
-    user = session.exec(statement).first()
+    user = (await session.exec(statement)).first()
 
-    # Verify user exists and password is correct
-    if not user or not auth_service.verify_password(request.password, user.password_hash):
+    # Verify user exists and password is correct (bcrypt runs on its own pool)
+    if not user or not await auth_service.verify_password_async(request.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail={
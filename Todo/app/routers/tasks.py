@@ -3,16 +3,25 @@ Task CRUD endpoints with JWT authentication and user-scoped access.
 All endpoints require valid JWT token and enforce task ownership.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session
+import base64
+import binascii
+import hashlib
+from datetime import datetime
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response, status
+from sqlmodel.ext.asyncio.session import AsyncSession
 from uuid import UUID
-from typing import List
-from app.database import get_session
-from app.dependencies import get_current_user
-from app.models.user import User
-from app.models.task import Task
-from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse
-from app.services import task_service
+from typing import Iterable, List, Optional, Tuple, Union
+from ..database import get_session
+from ..dependencies import AuthUser, get_current_user
+from ..models.task import Task
+from ..schemas.task import TaskCreate, TaskUpdate, TaskResponse
+from ..services import task_service
+
+# Upper bound on tasks accepted by the bulk create endpoint
+MAX_BULK_TASKS = 1000
+
+# Task reads are per-user and must be revalidated (via ETag) before reuse
+TASK_CACHE_CONTROL = "private, max-age=0, must-revalidate"
 
 
 router = APIRouter(
@@ -26,40 +35,115 @@ router = APIRouter(
 )
 
 
+def _tasks_etag(tasks: Iterable[Task]) -> str:
+    """
+    Weak ETag over the representation-relevant columns of the given tasks.
+    Hashing the row (not just updated_at) keeps it exact even when
+    timestamps have only second precision (SQLite).
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for task in tasks:
+        digest.update(task.id.bytes)
+        digest.update(repr((task.title, task.description, task.status, task.updated_at)).encode())
+    return f'W/"{digest.hexdigest()}"'
+
+
+def _encode_cursor(task: Task) -> str:
+    """Opaque page cursor pointing just past the given task."""
+    raw = f"{task.created_at.isoformat()}|{task.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Parse a cursor produced by _encode_cursor.
+
+    Raises:
+        HTTPException 400: If the cursor is malformed
+    """
+    try:
+        created_at, task_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(task_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check the request's If-None-Match header against an ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+def _not_modified(etag: str) -> Response:
+    """Empty 304 response for a matching conditional GET."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": TASK_CACHE_CONTROL}
+    )
+
+
 @router.get("/{user_id}/tasks", response_model=List[TaskResponse], status_code=status.HTTP_200_OK)
-def get_user_tasks(
+async def get_user_tasks(
     user_id: UUID,
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
-) -> List[Task]:
+    request: Request,
+    response: Response,
+    limit: int = Query(task_service.DEFAULT_PAGE_SIZE, ge=1, le=task_service.MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    current_user: AuthUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+) -> Union[List[Task], Response]:
     """
-    Get all tasks for a specific user.
+    Get one page of tasks for a specific user, newest first.
 
     **Authorization**: JWT user_id must match path user_id parameter.
 
+    **Query Parameters**:
+    - limit: Page size (default 50, max 500)
+    - cursor: Value of `X-Next-Cursor` from the previous page
+
     **Returns**: List of TaskResponse objects (empty array if no tasks).
+    A full page sends `X-Next-Cursor` for fetching the next one.
+    Sends an `ETag`; a matching `If-None-Match` gets an empty 304 response.
 
     **Errors**:
+    - 400: Malformed cursor
     - 401: Missing or invalid JWT token
     - 403: JWT user_id does not match path user_id
     """
     # Verify JWT user_id matches path user_id
-    if str(current_user.id) != str(user_id):
+    if current_user.id != user_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to access tasks for this user"
         )
 
-    tasks = task_service.get_user_tasks(session, user_id)
+    page_cursor = _decode_cursor(cursor) if cursor is not None else None
+    tasks = await task_service.get_user_tasks(session, user_id, limit, page_cursor)
+
+    etag = _tasks_etag(tasks)
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+
+    if len(tasks) == limit:
+        response.headers["X-Next-Cursor"] = _encode_cursor(tasks[-1])
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = TASK_CACHE_CONTROL
     return tasks
 
 
 @router.post("/{user_id}/tasks", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
-def create_task(
+async def create_task(
     user_id: UUID,
     task_data: TaskCreate,
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    current_user: AuthUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
 ) -> Task:
     """
     Create a new task for a user.
@@ -76,43 +160,78 @@ def create_task(
     - 422: Invalid request body (missing title, validation errors)
     """
     # Verify JWT user_id matches path user_id
-    if str(current_user.id) != str(user_id):
+    if current_user.id != user_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to create tasks for this user"
         )
 
-    task = task_service.create_task(session, user_id, task_data)
+    task = await task_service.create_task(session, user_id, task_data)
     return task
 
 
+@router.post("/{user_id}/tasks/bulk", response_model=List[TaskResponse], status_code=status.HTTP_201_CREATED)
+async def create_tasks_bulk(
+    user_id: UUID,
+    tasks_data: List[TaskCreate] = Body(..., min_length=1, max_length=MAX_BULK_TASKS),
+    current_user: AuthUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+) -> List[Task]:
+    """
+    Create many tasks for a user in one request.
+
+    **Authorization**: JWT user_id must match path user_id parameter.
+
+    **Request Body**: List of TaskCreate schemas (1 to 1000 items)
+
+    **Returns**: List of TaskResponse objects for the created tasks, in request order.
+
+    **Errors**:
+    - 401: Missing or invalid JWT token
+    - 403: JWT user_id does not match path user_id
+    - 422: Invalid request body (empty or oversized list, validation errors)
+    """
+    # Verify JWT user_id matches path user_id
+    if current_user.id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to create tasks for this user"
+        )
+
+    tasks = await task_service.create_tasks_bulk(session, user_id, tasks_data)
+    return tasks
+
+
 @router.get("/{user_id}/tasks/{task_id}", response_model=TaskResponse, status_code=status.HTTP_200_OK)
-def get_task(
+async def get_task(
     user_id: UUID,
     task_id: UUID,
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
-) -> Task:
+    request: Request,
+    response: Response,
+    current_user: AuthUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+) -> Union[Task, Response]:
     """
     Get a specific task by ID.
 
-    **Authorization**: JWT user_id must match path user_id, and task must belong to user.
+    **Authorization**: JWT user_id must match path user_id; tasks owned by other users are not found.
 
     **Returns**: TaskResponse with task details.
+    Sends an `ETag`; a matching `If-None-Match` gets an empty 304 response.
 
     **Errors**:
     - 401: Missing or invalid JWT token
-    - 403: User not authorized to access this task
+    - 403: JWT user_id does not match path user_id
     - 404: Task not found
     """
     # Verify JWT user_id matches path user_id
-    if str(current_user.id) != str(user_id):
+    if current_user.id != user_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to access tasks for this user"
         )
 
-    task = task_service.get_task_by_id(session, task_id)
+    task = await task_service.get_task_for_user(session, user_id, task_id)
 
     if not task:
         raise HTTPException(
@@ -120,28 +239,27 @@ def get_task(
             detail=f"Task with id {task_id} not found"
         )
 
-    # Verify task belongs to user
-    if not task_service.validate_task_ownership(task, user_id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this task"
-        )
+    etag = _tasks_etag([task])
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
 
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = TASK_CACHE_CONTROL
     return task
 
 
 @router.put("/{user_id}/tasks/{task_id}", response_model=TaskResponse, status_code=status.HTTP_200_OK)
-def update_task(
+async def update_task(
     user_id: UUID,
     task_id: UUID,
     task_data: TaskUpdate,
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    current_user: AuthUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
 ) -> Task:
     """
     Update a task (full update - all fields).
 
-    **Authorization**: JWT user_id must match path user_id, and task must belong to user.
+    **Authorization**: JWT user_id must match path user_id; tasks owned by other users are not found.
 
     **Request Body**: TaskUpdate schema (all fields optional)
 
@@ -149,93 +267,77 @@ def update_task(
 
     **Errors**:
     - 401: Missing or invalid JWT token
-    - 403: User not authorized to update this task
+    - 403: JWT user_id does not match path user_id
     - 404: Task not found
     - 422: Invalid request body
     """
     # Verify JWT user_id matches path user_id
-    if str(current_user.id) != str(user_id):
+    if current_user.id != user_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to update tasks for this user"
         )
 
-    task = task_service.get_task_by_id(session, task_id)
+    updated_task = await task_service.update_task(session, user_id, task_id, task_data)
 
-    if not task:
+    if not updated_task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task with id {task_id} not found"
         )
 
-    # Verify task belongs to user
-    if not task_service.validate_task_ownership(task, user_id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to update this task"
-        )
-
-    updated_task = task_service.update_task(session, task, task_data)
     return updated_task
 
 
 @router.patch("/{user_id}/tasks/{task_id}/complete", response_model=TaskResponse, status_code=status.HTTP_200_OK)
-def toggle_task_completion(
+async def toggle_task_completion(
     user_id: UUID,
     task_id: UUID,
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    current_user: AuthUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
 ) -> Task:
     """
     Toggle completion status of a task.
 
-    **Authorization**: JWT user_id must match path user_id, and task must belong to user.
+    **Authorization**: JWT user_id must match path user_id; tasks owned by other users are not found.
 
     **Returns**: TaskResponse with updated task status.
 
     **Errors**:
     - 401: Missing or invalid JWT token
-    - 403: User not authorized to update this task
+    - 403: JWT user_id does not match path user_id
     - 404: Task not found
     """
     # Verify JWT user_id matches path user_id
-    if str(current_user.id) != str(user_id):
+    if current_user.id != user_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to update tasks for this user"
         )
 
-    task = task_service.get_task_by_id(session, task_id)
+    updated_task = await task_service.toggle_task_completion(session, user_id, task_id)
 
-    if not task:
+    if not updated_task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task with id {task_id} not found"
         )
 
-    # Verify task belongs to user
-    if not task_service.validate_task_ownership(task, user_id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to update this task"
-        )
-
-    updated_task = task_service.toggle_task_completion(session, task)
     return updated_task
 
 
 @router.patch("/{user_id}/tasks/{task_id}", response_model=TaskResponse, status_code=status.HTTP_200_OK)
-def partial_update_task(
+async def partial_update_task(
     user_id: UUID,
     task_id: UUID,
     task_data: TaskUpdate,
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    current_user: AuthUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
 ) -> Task:
     """
     Partially update a task (only specified fields).
 
-    **Authorization**: JWT user_id must match path user_id, and task must belong to user.
+    **Authorization**: JWT user_id must match path user_id; tasks owned by other users are not found.
 
     **Request Body**: TaskUpdate schema (only provided fields will be updated)
 
@@ -243,76 +345,60 @@ def partial_update_task(
 
     **Errors**:
     - 401: Missing or invalid JWT token
-    - 403: User not authorized to update this task
+    - 403: JWT user_id does not match path user_id
     - 404: Task not found
     - 422: Invalid request body
     """
     # Verify JWT user_id matches path user_id
-    if str(current_user.id) != str(user_id):
+    if current_user.id != user_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to update tasks for this user"
         )
 
-    task = task_service.get_task_by_id(session, task_id)
+    updated_task = await task_service.update_task(session, user_id, task_id, task_data)
 
-    if not task:
+    if not updated_task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task with id {task_id} not found"
         )
 
-    # Verify task belongs to user
-    if not task_service.validate_task_ownership(task, user_id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to update this task"
-        )
-
-    updated_task = task_service.update_task(session, task, task_data)
     return updated_task
 
 
 @router.delete("/{user_id}/tasks/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_task(
+async def delete_task(
     user_id: UUID,
     task_id: UUID,
-    current_user: User = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    current_user: AuthUser = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
 ) -> None:
     """
     Delete a task.
 
-    **Authorization**: JWT user_id must match path user_id, and task must belong to user.
+    **Authorization**: JWT user_id must match path user_id; tasks owned by other users are not found.
 
     **Returns**: 204 No Content on success.
 
     **Errors**:
     - 401: Missing or invalid JWT token
-    - 403: User not authorized to delete this task
+    - 403: JWT user_id does not match path user_id
     - 404: Task not found
     """
     # Verify JWT user_id matches path user_id
-    if str(current_user.id) != str(user_id):
+    if current_user.id != user_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to delete tasks for this user"
         )
 
-    task = task_service.get_task_by_id(session, task_id)
+    deleted = await task_service.delete_task(session, user_id, task_id)
 
-    if not task:
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task with id {task_id} not found"
         )
 
-    # Verify task belongs to user
-    if not task_service.validate_task_ownership(task, user_id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to delete this task"
-        )
-
-    task_service.delete_task(session, task)
     return None
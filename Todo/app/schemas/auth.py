@@ -1,10 +1,14 @@
 """
 Pydantic schemas for authentication requests and responses.
 """
+import re
 from pydantic import BaseModel, EmailStr, Field, field_validator
 from uuid import UUID
 from typing import Optional
 
+# Single-pass check for the common case: 8+ chars with upper, lower and digit
+_PASSWORD_STRENGTH_RE = re.compile(r"(?=.*[A-Z])(?=.*[a-z])(?=.*\d).{8,}", re.DOTALL)
+
 
 class SignupRequest(BaseModel):
     """Request schema for user signup."""
@@ -31,6 +35,10 @@ class SignupRequest(BaseModel):
         - Contains at least one lowercase letter
         - Contains at least one digit
         """
+        if _PASSWORD_STRENGTH_RE.fullmatch(v):
+            return v
+
+        # Slow path: find which requirement failed for the error message
         if len(v) < 8:
             raise ValueError("Password must be at least 8 characters long")
 
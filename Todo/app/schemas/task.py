@@ -9,7 +9,10 @@ Defines TaskCreate, TaskUpdate, and TaskResponse models.
 from pydantic import BaseModel, Field, field_validator
 from uuid import UUID
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
+
+# Valid task statuses (validated natively by pydantic-core)
+TaskStatus = Literal["pending", "completed"]
 
 
 class TaskCreate(BaseModel):
@@ -24,9 +27,10 @@ class TaskCreate(BaseModel):
     @classmethod
     def validate_title_not_empty(cls, v: str) -> str:
         """Ensure title is not just whitespace"""
-        if not v.strip():
+        stripped = v.strip()
+        if not stripped:
             raise ValueError("Title cannot be empty or whitespace only")
-        return v.strip()
+        return stripped
 
     class Config:
         json_schema_extra = {
@@ -44,25 +48,18 @@ class TaskUpdate(BaseModel):
     """
     title: Optional[str] = Field(default=None, min_length=1, max_length=255, description="Task title")
     description: Optional[str] = Field(default=None, max_length=2000, description="Task description")
-    status: Optional[str] = Field(default=None, max_length=50, description="Task status (pending, completed)")
+    status: Optional[TaskStatus] = Field(default=None, description="Task status (pending, completed)")
 
     @field_validator("title")
     @classmethod
     def validate_title_not_empty(cls, v: Optional[str]) -> Optional[str]:
         """Ensure title is not just whitespace if provided"""
-        if v is not None and not v.strip():
+        if v is None:
+            return None
+        stripped = v.strip()
+        if not stripped:
             raise ValueError("Title cannot be empty or whitespace only")
-        return v.strip() if v else None
-
-    @field_validator("status")
-    @classmethod
-    def validate_status(cls, v: Optional[str]) -> Optional[str]:
-        """Validate status is one of allowed values"""
-        if v is not None:
-            allowed_statuses = ["pending", "completed"]
-            if v not in allowed_statuses:
-                raise ValueError(f"Status must be one of: {', '.join(allowed_statuses)}")
-        return v
+        return stripped
 
     class Config:
         json_schema_extra = {
@@ -83,7 +80,7 @@ class TaskResponse(BaseModel):
     user_id: UUID
     title: str
     description: Optional[str]
-    status: str
+    status: TaskStatus
     created_at: datetime
     updated_at: datetime
 
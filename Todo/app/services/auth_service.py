@@ -1,9 +1,12 @@
 """
 Authentication service for password hashing, JWT token generation, and verification.
 """
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from passlib.context import CryptContext
-from jose import JWTError, jwt
-from datetime import datetime, timedelta
+import jwt
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID
 
@@ -11,7 +14,18 @@ from ..config import settings
 
 
 # Password hashing context using bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
+
+# Dedicated workers for bcrypt (releases the GIL, so hashes run in parallel)
+_BCRYPT_POOL = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="bcrypt")
+
+# JWT signing key encoded once and the accepted algorithms
+_SIGNING_KEY = settings.BETTER_AUTH_SECRET.encode()
+_ALGS = [settings.JWT_ALGORITHM]
 
 
 def hash_password(password: str) -> str:
@@ -41,6 +55,35 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password on the bcrypt thread pool, without blocking the event loop.
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        Hashed password string (bcrypt format)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_BCRYPT_POOL, pwd_context.hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password on the bcrypt thread pool, without blocking the event loop.
+
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password to compare against
+
+    Returns:
+        True if password matches, False otherwise
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_BCRYPT_POOL, pwd_context.verify, plain_password, hashed_password)
+
+
 def create_jwt_token(user_id: UUID, email: str) -> str:
     """
     Create a JWT access token for authenticated user.
@@ -58,21 +101,22 @@ def create_jwt_token(user_id: UUID, email: str) -> str:
         - exp: expiration timestamp
         - iat: issued at timestamp
     """
-    # Calculate expiration time
-    expire = datetime.utcnow() + timedelta(minutes=settings.JWT_EXPIRE_MINUTES)
+    # Calculate expiration time from a single timestamp (shared with iat)
+    now = datetime.now(timezone.utc)
+    expire = now + timedelta(minutes=settings.JWT_EXPIRE_MINUTES)
 
     # Create token payload
     payload = {
         "sub": str(user_id),  # Subject (user ID)
         "email": email,
         "exp": expire,  # Expiration time
-        "iat": datetime.utcnow()  # Issued at
+        "iat": now  # Issued at
     }
 
     # Encode and sign token
     token = jwt.encode(
         payload,
-        settings.BETTER_AUTH_SECRET,
+        _SIGNING_KEY,
         algorithm=settings.JWT_ALGORITHM
     )
 
@@ -88,18 +132,15 @@ def decode_jwt_token(token: str) -> Optional[dict]:
 
     Returns:
         Decoded payload dict if valid, None if invalid/expired
-
-    Raises:
-        JWTError: If token is invalid, expired, or signature verification fails
     """
     try:
         payload = jwt.decode(
             token,
-            settings.BETTER_AUTH_SECRET,
-            algorithms=[settings.JWT_ALGORITHM]
+            _SIGNING_KEY,
+            algorithms=_ALGS
         )
         return payload
-    except JWTError:
+    except jwt.InvalidTokenError:
         return None
 
 
@@ -116,12 +157,12 @@ def verify_token_signature(token: str) -> bool:
     try:
         jwt.decode(
             token,
-            settings.BETTER_AUTH_SECRET,
-            algorithms=[settings.JWT_ALGORITHM],
+            _SIGNING_KEY,
+            algorithms=_ALGS,
             options={"verify_exp": False}  # Don't check expiration, just signature
         )
         return True
-    except JWTError:
+    except jwt.InvalidTokenError:
         return False
 
 
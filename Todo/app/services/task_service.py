@@ -1,150 +1,292 @@
 """
 Task service layer for business logic.
-Handles task retrieval, creation, updates, and ownership validation.
+Handles task retrieval, creation, updates, and user-scoped lookups.
 """
 
-from sqlmodel import Session, select
-from uuid import UUID
+import logging
 from datetime import datetime
-from typing import List, Optional
-from app.models.task import Task
-from app.schemas.task import TaskCreate, TaskUpdate
-
+from pydantic import ValidationError
+from sqlalchemy import case, delete, insert, tuple_, update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from uuid import UUID, uuid4
+from typing import Iterable, List, Optional, Tuple
+from .. import neon_http
+from ..models.task import Task
+from ..models.user import User
+from ..schemas.task import TaskCreate, TaskUpdate
+
+logger = logging.getLogger(__name__)
+
+# Rows per multi-row INSERT in create_tasks_bulk
+BULK_INSERT_BATCH_SIZE = 500
+
+# Page size bounds for get_user_tasks
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Read queries served over Neon's HTTP endpoint when enabled
+_TASK_COLUMNS = "id, user_id, title, description, status, created_at, updated_at"
+_USER_TASKS_SQL = (
+    f"SELECT {_TASK_COLUMNS} FROM tasks WHERE user_id = $1"
+    " AND ($2::timestamp IS NULL OR (created_at, id) < ($2::timestamp, $3::uuid))"
+    " ORDER BY created_at DESC, id DESC LIMIT $4"
+)
+_USER_TASK_SQL = f"SELECT {_TASK_COLUMNS} FROM tasks WHERE user_id = $1 AND id = $2"
+
+
+async def _query_tasks_over_http(sql: str, *params) -> Optional[List[Task]]:
+    """
+    Run a read-only task query over Neon's HTTP endpoint.
 
-def get_user_tasks(session: Session, user_id: UUID) -> List[Task]:
+    Returns:
+        List of Task objects, or None if HTTP reads are disabled, the
+        request failed or a row did not validate as a Task (callers then
+        fall back to the SQLAlchemy session)
+    """
+    if not neon_http.is_enabled():
+        return None
+
+    try:
+        rows = await neon_http.query(sql, params)
+        return [Task.model_validate(row) for row in rows]
+    except (neon_http.NeonHTTPError, ValidationError):
+        # Transport errors and rows in an unexpected text format both fall back
+        logger.warning("Neon HTTP read failed, falling back to SQLAlchemy", exc_info=True)
+        return None
+
+
+async def get_user_tasks(
+    session: AsyncSession,
+    user_id: UUID,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[Tuple[datetime, UUID]] = None
+) -> List[Task]:
     """
-    Retrieve all tasks for a specific user.
+    Retrieve one page of tasks for a specific user, newest first.
 
     Args:
         session: Database session
         user_id: UUID of the user
+        limit: Maximum number of tasks to return
+        cursor: (created_at, id) of the last task on the previous page;
+            only tasks after it in the ordering are returned
 
     Returns:
         List of Task objects belonging to the user (empty list if none)
     """
-    statement = select(Task).where(Task.user_id == user_id).order_by(Task.created_at.desc())
-    tasks = session.exec(statement).all()
-    return list(tasks)
+    cursor_ts, cursor_id = cursor if cursor is not None else (None, None)
+    tasks = await _query_tasks_over_http(_USER_TASKS_SQL, user_id, cursor_ts, cursor_id, limit)
+    if tasks is not None:
+        return tasks
 
+    statement = select(Task).where(Task.user_id == user_id)
+    if cursor is not None:
+        statement = statement.where(tuple_(Task.created_at, Task.id) < tuple_(cursor_ts, cursor_id))
+    statement = statement.order_by(Task.created_at.desc(), Task.id.desc()).limit(limit)
+    return (await session.exec(statement)).all()
 
-def create_task(session: Session, user_id: UUID, task_data: TaskCreate) -> Task:
+
+async def get_tasks_with_users(
+    session: AsyncSession, user_ids: Iterable[UUID]
+) -> List[Tuple[Task, User]]:
     """
-    Create a new task for a user.
+    Retrieve the tasks of several users together with their owners.
+
+    Runs two queries (tasks, then users) regardless of how many users are
+    requested, instead of loading each task's owner separately (N+1).
 
     Args:
         session: Database session
-        user_id: UUID of the task owner
-        task_data: TaskCreate schema with title and optional description
+        user_ids: UUIDs of the users
 
     Returns:
-        Created Task object with auto-generated id and timestamps
+        List of (task, owner) pairs, newest task first
     """
-    task = Task(
-        user_id=user_id,
-        title=task_data.title,
-        description=task_data.description,
-        status="pending",  # Default status for new tasks
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
+    user_ids = list(set(user_ids))
+    if not user_ids:
+        return []
+
+    task_statement = (
+        select(Task)
+        .where(Task.user_id.in_(user_ids))
+        .order_by(Task.created_at.desc(), Task.id.desc())
     )
+    tasks = (await session.exec(task_statement)).all()
 
-    session.add(task)
-    session.commit()
-    session.refresh(task)
+    user_statement = select(User).where(User.id.in_(user_ids))
+    users = {user.id: user for user in (await session.exec(user_statement)).all()}
 
-    return task
+    return [(task, users[task.user_id]) for task in tasks]
 
 
-def get_task_by_id(session: Session, task_id: UUID) -> Optional[Task]:
+async def create_task(session: AsyncSession, user_id: UUID, task_data: TaskCreate) -> Task:
     """
-    Retrieve a single task by its ID.
+    Create a new task for a user.
 
     Args:
         session: Database session
-        task_id: UUID of the task
+        user_id: UUID of the task owner
+        task_data: TaskCreate schema with title and optional description
 
     Returns:
-        Task object if found, None otherwise
+        Created Task object with auto-generated id and timestamps
     """
-    statement = select(Task).where(Task.id == task_id)
-    task = session.exec(statement).first()
+    # INSERT ... RETURNING hands back the server-generated timestamps in the
+    # same round-trip, so no follow-up refresh SELECT is needed
+    statement = (
+        insert(Task)
+        .values(
+            id=uuid4(),
+            user_id=user_id,
+            title=task_data.title,
+            description=task_data.description,
+            status="pending"  # Default status for new tasks
+        )
+        .returning(Task)
+    )
+    task = (await session.exec(statement)).scalar_one()
+    await session.commit()
+
     return task
 
 
-def update_task(session: Session, task: Task, task_data: TaskUpdate) -> Task:
+async def create_tasks_bulk(
+    session: AsyncSession, user_id: UUID, tasks_data: List[TaskCreate]
+) -> List[Task]:
     """
-    Update an existing task with provided data.
-    Only updates fields that are explicitly provided (not None).
+    Create many tasks for a user with multi-row INSERT ... RETURNING statements
+    (one round-trip per BULK_INSERT_BATCH_SIZE rows) and a single commit.
 
     Args:
         session: Database session
-        task: Existing Task object to update
-        task_data: TaskUpdate schema with optional fields
+        user_id: UUID of the task owner
+        tasks_data: TaskCreate schemas with title and optional description
 
     Returns:
-        Updated Task object
+        Created Task objects, in request order
     """
-    update_data = task_data.model_dump(exclude_unset=True)
+    rows = [
+        {
+            "id": uuid4(),
+            "user_id": user_id,
+            "title": task_data.title,
+            "description": task_data.description,
+            "status": "pending",
+        }
+        for task_data in tasks_data
+    ]
+
+    tasks: List[Task] = []
+    for start in range(0, len(rows), BULK_INSERT_BATCH_SIZE):
+        statement = insert(Task).values(rows[start:start + BULK_INSERT_BATCH_SIZE]).returning(Task)
+        tasks.extend((await session.exec(statement)).scalars().all())
+
+    await session.commit()
+
+    return tasks
 
-    for field, value in update_data.items():
-        setattr(task, field, value)
 
-    task.updated_at = datetime.utcnow()
+async def get_task_for_user(session: AsyncSession, user_id: UUID, task_id: UUID) -> Optional[Task]:
+    """
+    Retrieve a single task by its ID, scoped to its owner.
+    Ownership is enforced in SQL, so another user's task is never loaded.
 
-    session.add(task)
-    session.commit()
-    session.refresh(task)
+    Args:
+        session: Database session
+        user_id: UUID of the task owner
+        task_id: UUID of the task
 
+    Returns:
+        Task object if found and owned by the user, None otherwise
+    """
+    tasks = await _query_tasks_over_http(_USER_TASK_SQL, user_id, task_id)
+    if tasks is not None:
+        return tasks[0] if tasks else None
+
+    statement = select(Task).where(Task.user_id == user_id, Task.id == task_id)
+    task = (await session.exec(statement)).first()
     return task
 
 
-def delete_task(session: Session, task: Task) -> None:
+async def update_task(
+    session: AsyncSession, user_id: UUID, task_id: UUID, task_data: TaskUpdate
+) -> Optional[Task]:
     """
-    Delete a task from the database.
+    Update a user's task with provided data in a single UPDATE ... RETURNING.
+    Only updates fields that are explicitly provided (not None).
 
     Args:
         session: Database session
-        task: Task object to delete
+        user_id: UUID of the task owner
+        task_id: UUID of the task to update
+        task_data: TaskUpdate schema with optional fields
+
+    Returns:
+        Updated Task object, or None if no task with that id belongs to the user
     """
-    session.delete(task)
-    session.commit()
+    update_data = task_data.model_dump(exclude_unset=True)
+    if not update_data:
+        # Nothing to change: skip the write so updated_at (and the ETag) stay put
+        return await get_task_for_user(session, user_id, task_id)
+
+    statement = (
+        update(Task)
+        .where(Task.id == task_id, Task.user_id == user_id)
+        .values(**update_data)
+        .returning(Task)
+    )
+    task = (await session.exec(statement)).scalar_one_or_none()
+    await session.commit()
+
+    return task
 
 
-def validate_task_ownership(task: Task, user_id: UUID) -> bool:
+async def delete_task(session: AsyncSession, user_id: UUID, task_id: UUID) -> bool:
     """
-    Verify that a task belongs to a specific user.
+    Delete a user's task in a single DELETE ... RETURNING.
 
     Args:
-        task: Task object to check
-        user_id: UUID of the user claiming ownership
+        session: Database session
+        user_id: UUID of the task owner
+        task_id: UUID of the task to delete
 
     Returns:
-        True if task belongs to user, False otherwise
+        True if the task was deleted, False if no task with that id belongs to the user
     """
-    return task.user_id == user_id
+    statement = (
+        delete(Task)
+        .where(Task.id == task_id, Task.user_id == user_id)
+        .returning(Task.id)
+    )
+    deleted_id = (await session.exec(statement)).scalar_one_or_none()
+    await session.commit()
+
+    return deleted_id is not None
 
 
-def toggle_task_completion(session: Session, task: Task) -> Task:
+async def toggle_task_completion(session: AsyncSession, user_id: UUID, task_id: UUID) -> Optional[Task]:
     """
-    Toggle the completion status of a task.
+    Toggle the completion status of a user's task in a single UPDATE ... RETURNING.
     If the task is pending, change to completed. If completed, change to pending.
 
     Args:
         session: Database session
-        task: Task object to update
+        user_id: UUID of the task owner
+        task_id: UUID of the task to update
 
     Returns:
-        Updated Task object
+        Updated Task object, or None if no task with that id belongs to the user
     """
-    if task.status == "completed":
-        task.status = "pending"
-    else:
-        task.status = "completed"
-
-    task.updated_at = datetime.utcnow()
-
-    session.add(task)
-    session.commit()
-    session.refresh(task)
+    statement = (
+        update(Task)
+        .where(Task.id == task_id, Task.user_id == user_id)
+        .values(
+            status=case((Task.status == "completed", "pending"), else_="completed")
+        )
+        .returning(Task)
+    )
+    task = (await session.exec(statement)).scalar_one_or_none()
+    await session.commit()
 
     return task
@@ -12,11 +12,19 @@ if __name__ == "__main__":
     os.environ.setdefault('CORS_ORIGINS', 'http://localhost:3000,http://127.0.0.1:3000')
     os.environ.setdefault('ENVIRONMENT', 'development')
 
-    # Start the server
+    # Auto-reload only in development (RELOAD=true/false overrides); reload
+    # mode is single-process, otherwise run one worker per core (WORKERS)
+    reload = os.getenv('RELOAD', str(os.environ['ENVIRONMENT'] == 'development')).lower() in ('1', 'true', 'yes')
+    workers = 1 if reload else int(os.getenv('WORKERS', os.cpu_count() or 1))
+
+    # Start the server ("auto" picks uvloop and httptools, shipped with uvicorn[standard])
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
-        reload_dirs=["app"]
+        reload=reload,
+        reload_dirs=["app"] if reload else None,
+        workers=workers,
+        loop="auto",
+        http="auto"
     )
\ No newline at end of file
@@ -1,42 +1,99 @@
 """
 Pytest configuration and shared fixtures for backend tests.
 """
+import asyncio
+import os
 import sys
 from pathlib import Path
 
 # Add parent directory to path to import app modules
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
+# Minimum bcrypt cost keeps password hashing fast in tests (set before app import)
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
 from sqlmodel import Session, SQLModel, create_engine
-from sqlmodel.pool import StaticPool
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.main import app
 from app.database import get_session
 
 
-# Test database setup (in-memory SQLite for fast tests)
-@pytest.fixture(name="session")
-def session_fixture():
-    """Create a fresh database session for each test."""
+# Test database setup (file-backed SQLite so the sync test session and the
+# async app session see the same data). The engines and the TestClient are
+# built once per test run; each test only resets the schema.
+@pytest.fixture(name="db_path", scope="session")
+def db_path_fixture(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Path of the SQLite database file shared by the test run."""
+    return tmp_path_factory.mktemp("db") / "test.db"
+
+
+@pytest.fixture(name="engine", scope="session")
+def engine_fixture(db_path: Path):
+    """Sync engine used by tests to seed and inspect data."""
     engine = create_engine(
-        "sqlite:///:memory:",
+        f"sqlite:///{db_path}",
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
     )
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(name="async_engine", scope="session")
+def async_engine_fixture(db_path: Path):
+    """Async engine over the same database file, as used by the app."""
+    # NullPool: TestClient may run each request on a different event loop
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{db_path}",
+        poolclass=NullPool,
+    )
+    yield async_engine
+    asyncio.run(async_engine.dispose())
+
+
+@pytest.fixture(name="test_client", scope="session")
+def test_client_fixture(async_engine):
+    """Shared test client with the app's async database session overridden."""
+    async def get_session_override():
+        async with AsyncSession(async_engine, expire_on_commit=False) as async_session:
+            yield async_session
+
+    app.dependency_overrides[get_session] = get_session_override
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(name="session")
+def session_fixture(engine):
+    """Reset the schema and open a fresh database session for each test."""
+    SQLModel.metadata.drop_all(engine)
     SQLModel.metadata.create_all(engine)
     with Session(engine) as session:
         yield session
 
 
-@pytest.fixture(name="client")
-def client_fixture(session: Session):
-    """Create a test client with overridden database session."""
-    def get_session_override():
-        return session
+@pytest.fixture(name="run_async")
+def run_async_fixture(session: Session, async_engine):
+    """
+    Run an async service call against the freshly reset test database.
 
-    app.dependency_overrides[get_session] = get_session_override
-    client = TestClient(app)
-    yield client
-    app.dependency_overrides.clear()
+    Usage: run_async(lambda async_session: service_fn(async_session, ...))
+    """
+    def run(call):
+        async def main():
+            async with AsyncSession(async_engine, expire_on_commit=False) as async_session:
+                return await call(async_session)
+
+        return asyncio.run(main())
+
+    return run
+
+
+@pytest.fixture(name="client")
+def client_fixture(session: Session, test_client: TestClient):
+    """Test client over a freshly reset database."""
+    return test_client
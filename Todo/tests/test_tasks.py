@@ -10,6 +10,7 @@ from uuid import uuid4
 from app.models.user import User
 from app.models.task import Task
 from app.services.auth_service import hash_password, create_jwt_token
+from app.services.task_service import get_tasks_with_users
 
 
 # T048: Contract test for GET /api/{user_id}/tasks
@@ -224,3 +225,267 @@ def test_empty_task_list(client: TestClient, session: Session):
 
     assert response.status_code == 200
     assert response.json() == []
+
+
+def test_get_task_scoped_to_owner(client: TestClient, session: Session):
+    """Test GET /api/{user_id}/tasks/{task_id} returns 404 for another user's task"""
+    user_a = User(email="ownera@example.com", password_hash=hash_password("OwnerA123"))
+    user_b = User(email="ownerb@example.com", password_hash=hash_password("OwnerB123"))
+    session.add_all([user_a, user_b])
+    session.commit()
+    session.refresh(user_a)
+    session.refresh(user_b)
+
+    task = Task(user_id=user_a.id, title="Owner A Task", status="pending")
+    session.add(task)
+    session.commit()
+    session.refresh(task)
+
+    # Owner can fetch the task
+    token_a = create_jwt_token(user_a.id, user_a.email)
+    response = client.get(
+        f"/api/{user_a.id}/tasks/{task.id}",
+        headers={"Authorization": f"Bearer {token_a}"}
+    )
+    assert response.status_code == 200
+    assert response.json()["title"] == "Owner A Task"
+
+    # User B cannot see it under their own user_id
+    token_b = create_jwt_token(user_b.id, user_b.email)
+    response = client.get(
+        f"/api/{user_b.id}/tasks/{task.id}",
+        headers={"Authorization": f"Bearer {token_b}"}
+    )
+    assert response.status_code == 404
+
+
+def test_update_task_success(client: TestClient, session: Session):
+    """Test PUT/PATCH /api/{user_id}/tasks/{task_id} updates only provided fields"""
+    user = User(email="updater@example.com", password_hash=hash_password("UpdatePass123"))
+    session.add(user)
+    session.commit()
+    session.refresh(user)
+
+    task = Task(user_id=user.id, title="Original", description="Keep me", status="pending")
+    session.add(task)
+    session.commit()
+    session.refresh(task)
+
+    token = create_jwt_token(user.id, user.email)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.put(
+        f"/api/{user.id}/tasks/{task.id}",
+        json={"title": "Updated"},
+        headers=headers
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["title"] == "Updated"
+    assert data["description"] == "Keep me"
+
+    response = client.patch(
+        f"/api/{user.id}/tasks/{task.id}",
+        json={"status": "completed"},
+        headers=headers
+    )
+    assert response.status_code == 200
+    assert response.json()["status"] == "completed"
+    assert response.json()["title"] == "Updated"
+
+    # Empty update is a no-op
+    response = client.patch(f"/api/{user.id}/tasks/{task.id}", json={}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["status"] == "completed"
+
+    # Status outside the allowed values is rejected
+    response = client.patch(
+        f"/api/{user.id}/tasks/{task.id}",
+        json={"status": "archived"},
+        headers=headers
+    )
+    assert response.status_code == 422
+
+    # Unknown task
+    response = client.put(
+        f"/api/{user.id}/tasks/{uuid4()}",
+        json={"title": "Nope"},
+        headers=headers
+    )
+    assert response.status_code == 404
+
+
+def test_toggle_task_completion(client: TestClient, session: Session):
+    """Test PATCH /api/{user_id}/tasks/{task_id}/complete flips status both ways"""
+    user = User(email="toggler@example.com", password_hash=hash_password("TogglePass123"))
+    session.add(user)
+    session.commit()
+    session.refresh(user)
+
+    task = Task(user_id=user.id, title="Toggle me", status="pending")
+    session.add(task)
+    session.commit()
+    session.refresh(task)
+
+    token = create_jwt_token(user.id, user.email)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.patch(f"/api/{user.id}/tasks/{task.id}/complete", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["status"] == "completed"
+
+    response = client.patch(f"/api/{user.id}/tasks/{task.id}/complete", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["status"] == "pending"
+
+
+def test_delete_task_success(client: TestClient, session: Session):
+    """Test DELETE /api/{user_id}/tasks/{task_id} returns 204 then 404"""
+    user = User(email="deleter@example.com", password_hash=hash_password("DeletePass123"))
+    session.add(user)
+    session.commit()
+    session.refresh(user)
+
+    task = Task(user_id=user.id, title="Delete me", status="pending")
+    session.add(task)
+    session.commit()
+    session.refresh(task)
+
+    token = create_jwt_token(user.id, user.email)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.delete(f"/api/{user.id}/tasks/{task.id}", headers=headers)
+    assert response.status_code == 204
+
+    response = client.delete(f"/api/{user.id}/tasks/{task.id}", headers=headers)
+    assert response.status_code == 404
+
+
+def test_create_tasks_bulk_success(client: TestClient, session: Session):
+    """Test POST /api/{user_id}/tasks/bulk creates all tasks with 201 response"""
+    user = User(email="bulk@example.com", password_hash=hash_password("BulkPass123"))
+    session.add(user)
+    session.commit()
+    session.refresh(user)
+
+    token = create_jwt_token(user.id, user.email)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    tasks_data = [{"title": f"Bulk Task {i}", "description": f"Item {i}"} for i in range(25)]
+
+    response = client.post(f"/api/{user.id}/tasks/bulk", json=tasks_data, headers=headers)
+
+    assert response.status_code == 201
+    data = response.json()
+    assert [task["title"] for task in data] == [task["title"] for task in tasks_data]
+    assert all(task["user_id"] == str(user.id) for task in data)
+    assert all(task["status"] == "pending" for task in data)
+
+    # Empty list is rejected
+    response = client.post(f"/api/{user.id}/tasks/bulk", json=[], headers=headers)
+    assert response.status_code == 422
+
+
+def test_get_task_conditional_request(client: TestClient, session: Session):
+    """Test GET endpoints return ETag and honour If-None-Match with 304"""
+    user = User(email="etag@example.com", password_hash=hash_password("EtagPass123"))
+    session.add(user)
+    session.commit()
+    session.refresh(user)
+
+    task = Task(user_id=user.id, title="Cached Task", status="pending")
+    session.add(task)
+    session.commit()
+    session.refresh(task)
+
+    token = create_jwt_token(user.id, user.email)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    urls = (f"/api/{user.id}/tasks/{task.id}", f"/api/{user.id}/tasks")
+    etags = {}
+    for url in urls:
+        response = client.get(url, headers=headers)
+        assert response.status_code == 200
+        etags[url] = response.headers["etag"]
+
+        response = client.get(url, headers={**headers, "If-None-Match": etags[url]})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    # Changing the task changes both ETags
+    client.put(f"/api/{user.id}/tasks/{task.id}", json={"title": "Changed"}, headers=headers)
+    for url in urls:
+        response = client.get(url, headers={**headers, "If-None-Match": etags[url]})
+        assert response.status_code == 200
+
+
+def test_get_user_tasks_paginated(client: TestClient, session: Session):
+    """Test GET /api/{user_id}/tasks pages newest-first with limit and cursor"""
+    user = User(email="pager@example.com", password_hash=hash_password("PagerPass123"))
+    session.add(user)
+    session.commit()
+    session.refresh(user)
+
+    token = create_jwt_token(user.id, user.email)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    # Created through the API, so created_at comes from the database default
+    for i in range(5):
+        response = client.post(f"/api/{user.id}/tasks", json={"title": f"Task {i}"}, headers=headers)
+        assert response.status_code == 201
+
+    titles = []
+    params = {"limit": 2}
+    for _ in range(5):
+        response = client.get(f"/api/{user.id}/tasks", params=params, headers=headers)
+        assert response.status_code == 200
+        titles.extend(task["title"] for task in response.json())
+        if "x-next-cursor" not in response.headers:
+            break
+        params = {"limit": 2, "cursor": response.headers["x-next-cursor"]}
+
+    assert titles == [f"Task {i}" for i in reversed(range(5))]
+
+    # Limit is bounded and cursors are validated
+    response = client.get(f"/api/{user.id}/tasks", params={"limit": 501}, headers=headers)
+    assert response.status_code == 422
+    response = client.get(f"/api/{user.id}/tasks", params={"cursor": "not-a-cursor"}, headers=headers)
+    assert response.status_code == 400
+
+
+def test_get_tasks_with_users(session: Session, run_async):
+    """Test get_tasks_with_users pairs each task with its owner, newest first"""
+    alice = User(email="alice@example.com", password_hash="x")
+    bob = User(email="bob@example.com", password_hash="x")
+    carol = User(email="carol@example.com", password_hash="x")
+    session.add_all([alice, bob, carol])
+    session.commit()
+
+    session.add(Task(user_id=alice.id, title="Alice 1"))
+    session.commit()
+    session.add(Task(user_id=bob.id, title="Bob 1"))
+    session.commit()
+    session.add(Task(user_id=alice.id, title="Alice 2"))
+    session.commit()
+    session.add(Task(user_id=carol.id, title="Carol 1"))
+    session.commit()
+
+    pairs = run_async(lambda s: get_tasks_with_users(s, [alice.id, bob.id, alice.id]))
+
+    assert [(task.title, owner.email) for task, owner in pairs] == [
+        ("Alice 2", "alice@example.com"),
+        ("Bob 1", "bob@example.com"),
+        ("Alice 1", "alice@example.com"),
+    ]
+    assert all(task.user_id == owner.id for task, owner in pairs)
+
+
+def test_get_tasks_with_users_empty(session: Session, run_async):
+    """Test get_tasks_with_users returns [] for no users and for users without tasks"""
+    user = User(email="notasks@example.com", password_hash="x")
+    session.add(user)
+    session.commit()
+
+    assert run_async(lambda s: get_tasks_with_users(s, [])) == []
+    assert run_async(lambda s: get_tasks_with_users(s, [user.id])) == []
+    assert run_async(lambda s: get_tasks_with_users(s, [uuid4()])) == []
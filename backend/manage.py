@@ -0,0 +1,25 @@
+import argparse
+import asyncio
+
+from src.database import engine, init_db
+
+
+async def _init_db() -> None:
+    await init_db()
+    await engine.dispose()
+
+
+COMMANDS = {
+    "init-db": _init_db,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Todo API management commands")
+    parser.add_argument("command", choices=COMMANDS)
+    args = parser.parse_args()
+    asyncio.run(COMMANDS[args.command]())
+
+
+if __name__ == "__main__":
+    main()
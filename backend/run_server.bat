@@ -15,6 +15,9 @@ call venv\Scripts\activate.bat
 REM Install dependencies if not already installed
 pip install -r requirements.txt
 
+REM Create any missing tables
+python manage.py init-db
+
 REM Run the server
 echo Running the server on http://localhost:8000
 cd src
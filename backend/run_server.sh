@@ -15,6 +15,9 @@ source venv/bin/activate
 # Install dependencies if not already installed
 pip install -r requirements.txt
 
+# Create any missing tables
+python manage.py init-db
+
 # Run the server
 echo "Running the server on http://localhost:8000"
 cd src
@@ -1,37 +1,76 @@
-from typing import Annotated
+import time
+from typing import Annotated, Tuple
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..database import get_session
-from ..services import AuthService
-from ..models import User
+from ..services import AuthService, UserAuthCtx
 
 security = HTTPBearer()
 
+# Auth failures get a fresh exception each time: a shared instance would
+# accumulate every raise's frames on its __traceback__
+def _invalid_token() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid or expired token",
+        headers={"WWW-Authenticate": "Bearer"}
+    )
+
+
+def _user_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="User not found",
+        headers={"WWW-Authenticate": "Bearer"}
+    )
+
+
+# Verified tokens -> (user_id, exp); exp is re-checked on every hit
+_token_cache: "TTLCache[str, Tuple[int, float]]" = TTLCache(maxsize=10_000, ttl=60)
+# Recently loaded users, so cached tokens skip the users lookup too
+_user_cache: "TTLCache[int, UserAuthCtx]" = TTLCache(maxsize=10_000, ttl=30)
+
+
+def _resolve_token(token: str) -> int:
+    cached = _token_cache.get(token)
+    if cached is not None:
+        user_id, expires_at = cached
+        if time.time() < expires_at:
+            return user_id
+        _token_cache.pop(token, None)
 
-async def get_current_user(
-    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-    session: Annotated[Session, Depends(get_session)]
-) -> User:
-    token = credentials.credentials
     payload = AuthService.decode_token(token)
 
     if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-            headers={"WWW-Authenticate": "Bearer"}
-        )
+        raise _invalid_token()
+
+    try:
+        user_id = int(payload.get("sub"))
+        expires_at = float(payload["exp"])
+    except (KeyError, TypeError, ValueError):
+        raise _invalid_token()
+
+    _token_cache[token] = (user_id, expires_at)
+    return user_id
+
+
+async def get_current_user(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    session: Annotated[AsyncSession, Depends(get_session)]
+) -> UserAuthCtx:
+    user_id = _resolve_token(credentials.credentials)
+
+    user = _user_cache.get(user_id)
+    if user is not None:
+        return user
 
-    user_id = int(payload.get("sub"))
-    user = AuthService.get_user_by_id(session, user_id)
+    user = await AuthService.get_user_by_id(session, user_id)
 
     if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"}
-        )
+        raise _user_not_found()
 
+    _user_cache[user_id] = user
     return user
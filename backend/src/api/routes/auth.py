@@ -1,43 +1,28 @@
 from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ...database import get_session
-from ...models import UserCreate, UserRead, UserLogin
+from ...models import TokenResponse, UserCreate, UserLogin
 from ...services import AuthService
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
-class TokenResponse:
-    def __init__(self, access_token: str, token_type: str, user: UserRead):
-        self.access_token = access_token
-        self.token_type = token_type
-        self.user = user
-
-
 @router.post(
     "/register",
-    response_model=dict,
+    response_model=TokenResponse,
     status_code=status.HTTP_201_CREATED
 )
 async def register(
     user_data: UserCreate,
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_session)]
 ):
     try:
-        user = AuthService.register_user(session, user_data)
+        user = await AuthService.register_user(session, user_data)
         token = AuthService.create_access_token(user.id, user.email)
 
-        return {
-            "access_token": token,
-            "token_type": "bearer",
-            "user": {
-                "id": user.id,
-                "email": user.email,
-                "created_at": user.created_at.isoformat()
-            }
-        }
+        return TokenResponse(access_token=token, user=user)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -45,12 +30,12 @@ async def register(
         )
 
 
-@router.post("/login", response_model=dict)
+@router.post("/login", response_model=TokenResponse)
 async def login(
     credentials: UserLogin,
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_session)]
 ):
-    user = AuthService.authenticate_user(
+    user = await AuthService.authenticate_user(
         session, credentials.email, credentials.password
     )
 
@@ -62,12 +47,4 @@ async def login(
 
     token = AuthService.create_access_token(user.id, user.email)
 
-    return {
-        "access_token": token,
-        "token_type": "bearer",
-        "user": {
-            "id": user.id,
-            "email": user.email,
-            "created_at": user.created_at.isoformat()
-        }
-    }
+    return TokenResponse(access_token=token, user=user)
@@ -1,25 +1,95 @@
-from typing import Annotated, Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlmodel import Session
+import base64
+import binascii
+from datetime import datetime
+from typing import Annotated, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ...database import get_session
-from ...models import Task, TaskCreate, TaskRead, TaskUpdate, User
-from ...services import TaskService
+from ...models import Task, TaskCreate, TaskPage, TaskRead, TaskUpdate
+from ...services import TaskService, UserAuthCtx
 from ..dependencies import get_current_user
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
+# Clients may keep a copy, but must revalidate it (If-None-Match) before reuse
+_CACHE_CONTROL = "private, max-age=0, must-revalidate"
 
-@router.get("", response_model=List[TaskRead])
+
+def _encode_cursor(created_at: datetime, task_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{task_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        created_at, task_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(task_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def _etag(*parts: object) -> str:
+    return f'W/"{"-".join(map(str, parts))}"'
+
+
+def _version_stamp(updated_at: Optional[datetime]) -> int:
+    return int(updated_at.timestamp() * 1_000_000) if updated_at else 0
+
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return None
+
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    if etag in tags or "*" in tags:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+        )
+    return None
+
+
+@router.get("", response_model=TaskPage)
 async def list_tasks(
-    session: Annotated[Session, Depends(get_session)],
-    current_user: Annotated[User, Depends(get_current_user)],
-    completed: Annotated[Optional[bool], Query()] = None
+    request: Request,
+    response: Response,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    current_user: Annotated[UserAuthCtx, Depends(get_current_user)],
+    completed: Annotated[Optional[bool], Query()] = None,
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+    cursor: Annotated[Optional[str], Query()] = None
 ):
-    tasks = TaskService.get_tasks_by_user(
+    decoded_cursor = _decode_cursor(cursor) if cursor else None
+
+    # Cheap aggregate first; an unchanged task set skips the page query
+    count, last_updated_at = await TaskService.get_tasks_version(
         session, current_user.id, completed
     )
-    return tasks
+    etag = _etag("tasks", count, _version_stamp(last_updated_at))
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+
+    tasks = await TaskService.get_tasks_by_user(
+        session,
+        current_user.id,
+        completed,
+        limit,
+        decoded_cursor
+    )
+
+    next_cursor = None
+    if len(tasks) == limit:
+        next_cursor = _encode_cursor(tasks[-1]["created_at"], tasks[-1]["id"])
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _CACHE_CONTROL
+    return {"items": tasks, "next_cursor": next_cursor}
 
 
 @router.post(
@@ -29,20 +99,22 @@ async def list_tasks(
 )
 async def create_task(
     task_data: TaskCreate,
-    session: Annotated[Session, Depends(get_session)],
-    current_user: Annotated[User, Depends(get_current_user)]
+    session: Annotated[AsyncSession, Depends(get_session)],
+    current_user: Annotated[UserAuthCtx, Depends(get_current_user)]
 ):
-    task = TaskService.create_task(session, current_user.id, task_data)
+    task = await TaskService.create_task(session, current_user.id, task_data)
     return task
 
 
 @router.get("/{task_id}", response_model=TaskRead)
 async def get_task(
     task_id: int,
-    session: Annotated[Session, Depends(get_session)],
-    current_user: Annotated[User, Depends(get_current_user)]
+    request: Request,
+    response: Response,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    current_user: Annotated[UserAuthCtx, Depends(get_current_user)]
 ):
-    task = TaskService.get_task_by_id(session, task_id, current_user.id)
+    task = await TaskService.get_task_by_id(session, task_id, current_user.id)
 
     if not task:
         raise HTTPException(
@@ -50,6 +122,13 @@ async def get_task(
             detail="Task not found"
         )
 
+    etag = _etag("task", task.id, _version_stamp(task.updated_at))
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _CACHE_CONTROL
     return task
 
 
@@ -57,10 +136,10 @@ async def get_task(
 async def update_task(
     task_id: int,
     task_data: TaskUpdate,
-    session: Annotated[Session, Depends(get_session)],
-    current_user: Annotated[User, Depends(get_current_user)]
+    session: Annotated[AsyncSession, Depends(get_session)],
+    current_user: Annotated[UserAuthCtx, Depends(get_current_user)]
 ):
-    task = TaskService.update_task(
+    task = await TaskService.update_task(
         session, task_id, current_user.id, task_data
     )
 
@@ -76,10 +155,10 @@ async def update_task(
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_task(
     task_id: int,
-    session: Annotated[Session, Depends(get_session)],
-    current_user: Annotated[User, Depends(get_current_user)]
+    session: Annotated[AsyncSession, Depends(get_session)],
+    current_user: Annotated[UserAuthCtx, Depends(get_current_user)]
 ):
-    deleted = TaskService.delete_task(session, task_id, current_user.id)
+    deleted = await TaskService.delete_task(session, task_id, current_user.id)
 
     if not deleted:
         raise HTTPException(
@@ -91,10 +170,10 @@ async def delete_task(
 @router.patch("/{task_id}/complete", response_model=TaskRead)
 async def toggle_task_completion(
     task_id: int,
-    session: Annotated[Session, Depends(get_session)],
-    current_user: Annotated[User, Depends(get_current_user)]
+    session: Annotated[AsyncSession, Depends(get_session)],
+    current_user: Annotated[UserAuthCtx, Depends(get_current_user)]
 ):
-    task = TaskService.toggle_task_completion(
+    task = await TaskService.toggle_task_completion(
         session, task_id, current_user.id
     )
 
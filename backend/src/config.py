@@ -1,14 +1,31 @@
-from pydantic_settings import BaseSettings
+from typing import Annotated, List
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, NoDecode
 from functools import lru_cache
 
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    # Connection pool (server databases only)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
     BETTER_AUTH_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRY_DAYS: int = 7
     DEBUG: bool = False
-    CORS_ORIGINS: str = "http://localhost:3000"
+    # Create missing tables on app startup (always on when DEBUG is set)
+    RUN_INIT_DB: bool = False
+    # Comma-separated in the environment, e.g. "http://a.com, http://b.com"
+    CORS_ORIGINS: Annotated[List[str], NoDecode] = ["http://localhost:3000"]
+
+    @field_validator("CORS_ORIGINS", mode="before")
+    @classmethod
+    def split_cors_origins(cls, value):
+        if isinstance(value, str):
+            return [origin.strip() for origin in value.split(",") if origin.strip()]
+        return value
 
     class Config:
         env_file = ".env"
@@ -1,20 +1,48 @@
-from typing import Generator
-from sqlmodel import SQLModel, Session, create_engine
+from typing import AsyncGenerator
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 from ..config import settings
+from .. import models  # noqa: F401  (registers the tables on SQLModel.metadata)
 
-engine = create_engine(
-    settings.DATABASE_URL,
+
+def _async_database_url(url: str) -> str:
+    # Map sync URLs onto their asyncio drivers (asyncpg takes "ssl", not "sslmode")
+    if url.startswith(("postgresql://", "postgres://")):
+        url = "postgresql+asyncpg://" + url.split("://", 1)[1]
+        url = url.replace("sslmode=", "ssl=")
+    elif url.startswith("sqlite://"):
+        url = url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return url
+
+
+DATABASE_URL = _async_database_url(settings.DATABASE_URL)
+
+# Pool sizing applies to server databases only (SQLite uses its own pools)
+_pool_options = {} if DATABASE_URL.startswith("sqlite") else {
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+}
+
+engine = create_async_engine(
+    DATABASE_URL,
     echo=settings.DEBUG,
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10
+    **_pool_options
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    engine, class_=AsyncSession, expire_on_commit=False
 )
 
 
-def init_db() -> None:
-    SQLModel.metadata.create_all(engine)
+async def init_db() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
 
 
-def get_session() -> Generator[Session, None, None]:
-    with Session(engine) as session:
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as session:
         yield session
@@ -1,6 +1,8 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .config import settings
 from .database import init_db
@@ -9,7 +11,10 @@ from .api.routes import auth_router, tasks_router
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    init_db()
+    # Schema creation is a dev convenience; deployments run `manage.py init-db`
+    # once instead of every worker introspecting the database on boot
+    if settings.DEBUG or settings.RUN_INIT_DB:
+        await init_db()
     yield
 
 
@@ -17,17 +22,21 @@ app = FastAPI(
     title="Todo API",
     description="Full-stack Todo application API with JWT authentication",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS.split(","),
+    allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress larger JSON responses (task pages); level 1 keeps the CPU cost low
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+
 app.include_router(auth_router, prefix="/api")
 app.include_router(tasks_router, prefix="/api")
 
@@ -1,7 +1,7 @@
-from .user import User, UserCreate, UserRead, UserLogin
-from .task import Task, TaskCreate, TaskRead, TaskUpdate
+from .user import User, UserCreate, UserRead, UserLogin, TokenResponse
+from .task import Task, TaskCreate, TaskRead, TaskPage, TaskUpdate
 
 __all__ = [
-    "User", "UserCreate", "UserRead", "UserLogin",
-    "Task", "TaskCreate", "TaskRead", "TaskUpdate"
+    "User", "UserCreate", "UserRead", "UserLogin", "TokenResponse",
+    "Task", "TaskCreate", "TaskRead", "TaskPage", "TaskUpdate"
 ]
@@ -1,7 +1,10 @@
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
+from sqlalchemy import DateTime, Index, text
 from sqlmodel import SQLModel, Field, Relationship
 
+from .timestamps import utcnow
+
 if TYPE_CHECKING:
     from .user import User
 
@@ -14,11 +17,29 @@ class TaskBase(SQLModel):
 
 class Task(TaskBase, table=True):
     __tablename__ = "tasks"
+    # Both lead with user_id, so no separate single-column user_id index
+    __table_args__ = (
+        # Task list, newest first
+        Index("ix_tasks_user_created", "user_id", text("created_at DESC")),
+        # Task list filtered by completion
+        Index("ix_tasks_user_completed", "user_id", "completed"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="users.id", index=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    user_id: int = Field(foreign_key="users.id")
+    # Timestamps are set by the database (on insert, and on every UPDATE)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": utcnow()}
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": utcnow(), "onupdate": utcnow()}
+    )
 
     user: Optional["User"] = Relationship(back_populates="tasks")
 
@@ -38,6 +59,11 @@ class TaskRead(SQLModel):
     user_id: int
 
 
+class TaskPage(SQLModel):
+    items: List[TaskRead]
+    next_cursor: Optional[str] = None
+
+
 class TaskUpdate(SQLModel):
     title: Optional[str] = Field(default=None, max_length=255)
     description: Optional[str] = Field(default=None, max_length=1000)
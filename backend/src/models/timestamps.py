@@ -0,0 +1,21 @@
+from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+
+
+class utcnow(FunctionElement):
+    # Database-side "now", used for server-generated timestamps
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "sqlite")
+def _sqlite_utcnow(element, compiler, **kw):
+    # Microsecond precision in SQLAlchemy's SQLite storage format, so stored
+    # values order and compare correctly against bound datetimes
+    return "(STRFTIME('%Y-%m-%d %H:%M:%f000', 'now'))"
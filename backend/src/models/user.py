@@ -1,7 +1,10 @@
 from datetime import datetime
-from typing import Optional, List, TYPE_CHECKING
+from typing import Literal, Optional, List, TYPE_CHECKING
+from sqlalchemy import DateTime
 from sqlmodel import SQLModel, Field, Relationship
 
+from .timestamps import utcnow
+
 if TYPE_CHECKING:
     from .task import Task
 
@@ -15,7 +18,12 @@ class User(UserBase, table=True):
 
     id: Optional[int] = Field(default=None, primary_key=True)
     password_hash: str = Field(max_length=255)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": utcnow()}
+    )
 
     tasks: List["Task"] = Relationship(back_populates="user")
 
@@ -34,3 +42,9 @@ class UserRead(SQLModel):
 class UserLogin(SQLModel):
     email: str
     password: str
+
+
+class TokenResponse(SQLModel):
+    access_token: str
+    token_type: Literal["bearer"] = "bearer"
+    user: UserRead
@@ -1,4 +1,4 @@
-from .auth_service import AuthService
+from .auth_service import AuthService, UserAuthCtx
 from .task_service import TaskService
 
-__all__ = ["AuthService", "TaskService"]
+__all__ = ["AuthService", "TaskService", "UserAuthCtx"]
@@ -1,84 +1,221 @@
-from datetime import datetime, timedelta
+import asyncio
+import base64
+import binascii
+import hashlib
+import hmac
+import time
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional
-from passlib.context import CryptContext
+import bcrypt
+import orjson
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from jose import jwt, JWTError
-from sqlmodel import Session, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..models import User, UserCreate, UserRead
 from ..config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# New hashes use argon2id; existing bcrypt hashes still verify
+_password_hasher = PasswordHasher()
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+# bcrypt only reads the first 72 bytes of a password
+_BCRYPT_MAX_BYTES = 72
+
+# Dialect-specific INSERT constructs supporting ON CONFLICT
+_upsert_insert = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+# Settings read on every token operation, bound once at import
+_SECRET = settings.BETTER_AUTH_SECRET
+_ALG = settings.JWT_ALGORITHM
+_ALGS = [_ALG]
+_EXPIRY_SECONDS = settings.JWT_EXPIRY_DAYS * 86400
+
+# HS* tokens are built and verified directly with hmac; python-jose is only
+# used if another algorithm is configured
+_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+_JWT_DIGEST = _HMAC_DIGESTS.get(_ALG)
+_JWT_KEY = _SECRET.encode()
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+def _is_numeric_date(value: object) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+_JWT_HEADER_B64 = _b64url_encode(
+    orjson.dumps({"alg": _ALG, "typ": "JWT"})
+)
+
+
+@dataclass(frozen=True, slots=True)
+class UserAuthCtx:
+    id: int
+    email: str
+    created_at: datetime
 
 
 class AuthService:
     @staticmethod
     def hash_password(password: str) -> str:
-        return pwd_context.hash(password)
+        return _password_hasher.hash(password)
 
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
-        return pwd_context.verify(plain_password, hashed_password)
+        if hashed_password.startswith(_BCRYPT_PREFIXES):
+            try:
+                return bcrypt.checkpw(
+                    plain_password.encode()[:_BCRYPT_MAX_BYTES],
+                    hashed_password.encode()
+                )
+            except ValueError:
+                return False
+
+        try:
+            return _password_hasher.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    # Hashing is CPU-bound; run it in the default executor, off the event loop
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, AuthService.hash_password, password)
+
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, AuthService.verify_password, plain_password, hashed_password
+        )
 
     @staticmethod
     def create_access_token(user_id: int, email: str) -> str:
-        expire = datetime.utcnow() + timedelta(days=settings.JWT_EXPIRY_DAYS)
+        expire = int(time.time()) + _EXPIRY_SECONDS
         to_encode = {
             "sub": str(user_id),
             "email": email,
             "exp": expire
         }
-        return jwt.encode(
-            to_encode,
-            settings.BETTER_AUTH_SECRET,
-            algorithm=settings.JWT_ALGORITHM
-        )
+
+        if _JWT_DIGEST is None:
+            return jwt.encode(
+                to_encode,
+                _SECRET,
+                algorithm=_ALG
+            )
+
+        signing_input = _JWT_HEADER_B64 + b"." + _b64url_encode(orjson.dumps(to_encode))
+        signature = hmac.new(_JWT_KEY, signing_input, _JWT_DIGEST).digest()
+        return (signing_input + b"." + _b64url_encode(signature)).decode()
 
     @staticmethod
     def decode_token(token: str) -> Optional[dict]:
+        if _JWT_DIGEST is None:
+            try:
+                payload = jwt.decode(
+                    token,
+                    _SECRET,
+                    algorithms=_ALGS,
+                    options={"require_exp": True}
+                )
+                return payload
+            except JWTError:
+                return None
+
         try:
-            payload = jwt.decode(
-                token,
-                settings.BETTER_AUTH_SECRET,
-                algorithms=[settings.JWT_ALGORITHM]
-            )
-            return payload
-        except JWTError:
+            header_b64, payload_b64, signature_b64 = token.encode().split(b".")
+            header = orjson.loads(_b64url_decode(header_b64))
+            signature = _b64url_decode(signature_b64)
+        except (ValueError, binascii.Error):
+            return None
+
+        if not isinstance(header, dict) or header.get("alg") != _ALG:
+            return None
+
+        expected = hmac.new(_JWT_KEY, header_b64 + b"." + payload_b64, _JWT_DIGEST).digest()
+        if not hmac.compare_digest(expected, signature):
+            return None
+
+        try:
+            payload = orjson.loads(_b64url_decode(payload_b64))
+        except (ValueError, binascii.Error):
+            return None
+
+        if not isinstance(payload, dict):
+            return None
+
+        # exp is required and must be in the future; nbf and iat are checked
+        # as python-jose does (nbf must have passed, iat must be numeric)
+        now = time.time()
+        exp = payload.get("exp")
+        if not _is_numeric_date(exp) or exp <= now:
             return None
 
+        nbf = payload.get("nbf")
+        if nbf is not None and (not _is_numeric_date(nbf) or nbf > now):
+            return None
+
+        iat = payload.get("iat")
+        if iat is not None and not _is_numeric_date(iat):
+            return None
+
+        return payload
+
     @staticmethod
-    def register_user(session: Session, user_data: UserCreate) -> User:
-        existing_user = session.exec(
-            select(User).where(User.email == user_data.email)
-        ).first()
+    async def register_user(session: AsyncSession, user_data: UserCreate) -> UserAuthCtx:
+        password_hash = await AuthService.hash_password_async(user_data.password)
+
+        # Single INSERT ... ON CONFLICT DO NOTHING RETURNING: the unique email
+        # index rejects duplicates atomically (no row comes back), and the
+        # generated id and created_at return with the write
+        insert = _upsert_insert[session.bind.dialect.name]
+        row = (await session.exec(
+            insert(User)
+            .values(email=user_data.email, password_hash=password_hash)
+            .on_conflict_do_nothing(index_elements=["email"])
+            .returning(User.id, User.email, User.created_at)
+        )).first()
+        await session.commit()
 
-        if existing_user:
+        if row is None:
             raise ValueError("Email already registered")
 
-        user = User(
-            email=user_data.email,
-            password_hash=AuthService.hash_password(user_data.password)
-        )
-        session.add(user)
-        session.commit()
-        session.refresh(user)
-        return user
+        return UserAuthCtx(*row)
 
     @staticmethod
-    def authenticate_user(
-        session: Session, email: str, password: str
-    ) -> Optional[User]:
-        user = session.exec(
-            select(User).where(User.email == email)
-        ).first()
-
-        if not user:
+    async def authenticate_user(
+        session: AsyncSession, email: str, password: str
+    ) -> Optional[UserAuthCtx]:
+        row = (await session.exec(
+            select(User.id, User.email, User.created_at, User.password_hash)
+            .where(User.email == email)
+        )).first()
+
+        if not row:
             return None
 
-        if not AuthService.verify_password(password, user.password_hash):
+        if not await AuthService.verify_password_async(password, row.password_hash):
             return None
 
-        return user
+        return UserAuthCtx(row.id, row.email, row.created_at)
 
     @staticmethod
-    def get_user_by_id(session: Session, user_id: int) -> Optional[User]:
-        return session.get(User, user_id)
+    async def get_user_by_id(
+        session: AsyncSession, user_id: int
+    ) -> Optional[UserAuthCtx]:
+        row = (await session.exec(
+            select(User.id, User.email, User.created_at).where(User.id == user_id)
+        )).first()
+        return UserAuthCtx(*row) if row else None
@@ -1,95 +1,134 @@
 from datetime import datetime
-from typing import List, Optional
-from sqlmodel import Session, select
+from typing import List, Optional, Tuple
+from sqlalchemy import RowMapping, delete, func, insert, lambda_stmt, not_, tuple_, update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ..models import Task, TaskCreate, TaskUpdate
 
 
 class TaskService:
     @staticmethod
-    def get_tasks_by_user(
-        session: Session,
+    async def get_tasks_by_user(
+        session: AsyncSession,
         user_id: int,
-        completed: Optional[bool] = None
-    ) -> List[Task]:
-        query = select(Task).where(Task.user_id == user_id)
+        completed: Optional[bool] = None,
+        limit: int = 50,
+        cursor: Optional[Tuple[datetime, int]] = None
+    ) -> List[RowMapping]:
+        # Column projection: plain rows, no ORM hydration or lazy relationships.
+        # lambda_stmt caches the statement construction and its compiled SQL;
+        # the closure values are extracted as bound parameters on each call
+        query = lambda_stmt(lambda: select(
+            Task.id,
+            Task.title,
+            Task.description,
+            Task.completed,
+            Task.created_at,
+            Task.updated_at,
+            Task.user_id
+        ).where(Task.user_id == user_id))
 
         if completed is not None:
-            query = query.where(Task.completed == completed)
+            query += lambda s: s.where(Task.completed == completed)
 
-        query = query.order_by(Task.created_at.desc())
-        return list(session.exec(query).all())
+        # Keyset pagination: resume after the (created_at, id) of the last row
+        if cursor is not None:
+            cursor_created_at, cursor_id = cursor
+            query += lambda s: s.where(
+                tuple_(Task.created_at, Task.id) < tuple_(cursor_created_at, cursor_id)
+            )
+
+        query += lambda s: s.order_by(Task.created_at.desc(), Task.id.desc()).limit(limit)
+        return (await session.exec(query)).mappings().all()
+
+    @staticmethod
+    async def get_tasks_version(
+        session: AsyncSession, user_id: int, completed: Optional[bool] = None
+    ) -> Tuple[int, Optional[datetime]]:
+        # (row count, latest updated_at): changes on every insert, update and delete
+        query = lambda_stmt(lambda: select(
+            func.count(Task.id), func.max(Task.updated_at)
+        ).where(Task.user_id == user_id))
+
+        if completed is not None:
+            query += lambda s: s.where(Task.completed == completed)
+
+        return tuple((await session.exec(query)).one())
 
     @staticmethod
-    def get_task_by_id(
-        session: Session, task_id: int, user_id: int
+    async def get_task_by_id(
+        session: AsyncSession, task_id: int, user_id: int
     ) -> Optional[Task]:
-        task = session.get(Task, task_id)
-        if task and task.user_id == user_id:
-            return task
-        return None
+        # Ownership is part of the query, so another user's task is never loaded
+        query = lambda_stmt(
+            lambda: select(Task).where(Task.id == task_id, Task.user_id == user_id)
+        )
+        return (await session.exec(query)).scalars().first()
 
     @staticmethod
-    def create_task(
-        session: Session, user_id: int, task_data: TaskCreate
+    async def create_task(
+        session: AsyncSession, user_id: int, task_data: TaskCreate
     ) -> Task:
-        task = Task(
-            user_id=user_id,
-            title=task_data.title,
-            description=task_data.description
+        # Single INSERT ... RETURNING: the id and timestamps come back with
+        # the write, so there's no refresh SELECT after the commit
+        query = (
+            insert(Task)
+            .values(
+                user_id=user_id,
+                title=task_data.title,
+                description=task_data.description
+            )
+            .returning(Task)
         )
-        session.add(task)
-        session.commit()
-        session.refresh(task)
+        task = (await session.exec(query)).scalar_one()
+        await session.commit()
         return task
 
     @staticmethod
-    def update_task(
-        session: Session,
+    async def update_task(
+        session: AsyncSession,
         task_id: int,
         user_id: int,
         task_data: TaskUpdate
     ) -> Optional[Task]:
-        task = TaskService.get_task_by_id(session, task_id, user_id)
-
-        if not task:
-            return None
-
         update_data = task_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(task, field, value)
 
-        task.updated_at = datetime.utcnow()
-        session.add(task)
-        session.commit()
-        session.refresh(task)
+        # Single UPDATE ... RETURNING, scoped to the owner
+        query = (
+            update(Task)
+            .where(Task.id == task_id, Task.user_id == user_id)
+            .values(**update_data)
+            .returning(Task)
+        )
+        task = (await session.exec(query)).scalar_one_or_none()
+        await session.commit()
         return task
 
     @staticmethod
-    def delete_task(
-        session: Session, task_id: int, user_id: int
+    async def delete_task(
+        session: AsyncSession, task_id: int, user_id: int
     ) -> bool:
-        task = TaskService.get_task_by_id(session, task_id, user_id)
-
-        if not task:
-            return False
-
-        session.delete(task)
-        session.commit()
-        return True
+        query = (
+            delete(Task)
+            .where(Task.id == task_id, Task.user_id == user_id)
+            .returning(Task.id)
+        )
+        deleted_id = (await session.exec(query)).scalar_one_or_none()
+        await session.commit()
+        return deleted_id is not None
 
     @staticmethod
-    def toggle_task_completion(
-        session: Session, task_id: int, user_id: int
+    async def toggle_task_completion(
+        session: AsyncSession, task_id: int, user_id: int
     ) -> Optional[Task]:
-        task = TaskService.get_task_by_id(session, task_id, user_id)
-
-        if not task:
-            return None
-
-        task.completed = not task.completed
-        task.updated_at = datetime.utcnow()
-        session.add(task)
-        session.commit()
-        session.refresh(task)
+        # Flip in SQL, so concurrent toggles can't overwrite each other
+        query = (
+            update(Task)
+            .where(Task.id == task_id, Task.user_id == user_id)
+            .values(completed=not_(Task.completed))
+            .returning(Task)
+        )
+        task = (await session.exec(query)).scalar_one_or_none()
+        await session.commit()
         return task
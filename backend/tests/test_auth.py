@@ -1,29 +1,48 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import time
+
 import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
-from sqlmodel import Session, SQLModel, create_engine
-from sqlmodel.pool import StaticPool
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.main import app
+from src.api.dependencies import _resolve_token
+from src.config import settings
 from src.database import get_session
 from src.models import User
+from src.services import AuthService
 
 
-@pytest.fixture(name="session")
-def session_fixture():
-    engine = create_engine(
-        "sqlite://",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
+@pytest.fixture(name="engine")
+def engine_fixture(tmp_path):
+    # File-backed SQLite; NullPool since TestClient may use a new event loop per request
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'test.db'}",
+        poolclass=NullPool,
     )
-    SQLModel.metadata.create_all(engine)
-    with Session(engine) as session:
-        yield session
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+    asyncio.run(create_tables())
+    yield engine
+    asyncio.run(engine.dispose())
 
 
 @pytest.fixture(name="client")
-def client_fixture(session: Session):
-    def get_session_override():
-        return session
+def client_fixture(engine):
+    async def get_session_override():
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
 
     app.dependency_overrides[get_session] = get_session_override
     client = TestClient(app)
@@ -86,3 +105,91 @@ def test_login_nonexistent_user(client: TestClient):
         json={"email": "nonexistent@example.com", "password": "password123"}
     )
     assert response.status_code == 401
+
+
+def test_rejected_token(client: TestClient):
+    for _ in range(3):
+        response = client.get(
+            "/api/tasks",
+            headers={"Authorization": "Bearer not-a-token"}
+        )
+        assert response.status_code == 401
+        assert response.headers["www-authenticate"] == "Bearer"
+
+
+def test_rejected_token_traceback_does_not_grow():
+    def traceback_depth(exc: BaseException) -> int:
+        depth, tb = 0, exc.__traceback__
+        while tb is not None:
+            depth, tb = depth + 1, tb.tb_next
+        return depth
+
+    rejections = []
+    for _ in range(50):
+        with pytest.raises(HTTPException) as exc_info:
+            _resolve_token("not-a-token")
+        rejections.append(exc_info.value)
+
+    assert rejections[0] is not rejections[-1]
+    assert traceback_depth(rejections[-1]) == traceback_depth(rejections[0])
+
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _make_token(payload: dict, key: str = settings.BETTER_AUTH_SECRET, alg: str = "HS256") -> str:
+    signing_input = (
+        _b64url(json.dumps({"alg": alg, "typ": "JWT"}).encode())
+        + "." + _b64url(json.dumps(payload).encode())
+    )
+    digests = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+    signature = hmac.new(key.encode(), signing_input.encode(), digests[alg]).digest() if alg in digests else b""
+    return signing_input + "." + _b64url(signature)
+
+
+def _claims(**overrides) -> dict:
+    claims = {"sub": "1", "email": "test@example.com", "exp": int(time.time()) + 3600}
+    claims.update(overrides)
+    return {name: value for name, value in claims.items() if value is not None}
+
+
+def test_decode_token_valid():
+    token = AuthService.create_access_token(1, "test@example.com")
+    payload = AuthService.decode_token(token)
+    assert payload["sub"] == "1"
+    assert payload["email"] == "test@example.com"
+
+    assert AuthService.decode_token(_make_token(_claims(nbf=int(time.time()) - 10, iat=int(time.time())))) is not None
+
+
+def _tampered_token() -> str:
+    header, payload, signature = AuthService.create_access_token(1, "test@example.com").split(".")
+    forged = _b64url(json.dumps(_claims(sub="2")).encode())
+    return ".".join([header, forged, signature])
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        _make_token(_claims(), key="wrong-secret"),
+        _make_token(_claims(), alg="none"),
+        _make_token(_claims(), alg="HS512"),
+        _tampered_token(),
+        _make_token(_claims(exp=int(time.time()) - 10)),
+        _make_token(_claims(exp=None)),
+        _make_token(_claims(exp="tomorrow")),
+        _make_token(_claims(nbf=int(time.time()) + 3600)),
+        _make_token(_claims(iat="now")),
+        "not-a-token",
+        "!!!.!!!.!!!",
+        _b64url(b"not json") + "." + _b64url(b"not json") + ".",
+    ],
+    ids=[
+        "wrong-key", "alg-none", "other-hs-alg", "tampered-signature", "expired",
+        "missing-exp", "non-numeric-exp", "future-nbf", "non-numeric-iat",
+        "not-a-jwt", "bad-base64", "bad-json",
+    ],
+)
+def test_decode_token_rejects(token: str):
+    assert AuthService.decode_token(token) is None
@@ -1,7 +1,11 @@
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session, SQLModel, create_engine
-from sqlmodel.pool import StaticPool
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.main import app
 from src.database import get_session
@@ -9,22 +13,28 @@ from src.models import User, Task
 from src.services import AuthService
 
 
-@pytest.fixture(name="session")
-def session_fixture():
-    engine = create_engine(
-        "sqlite://",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
+@pytest.fixture(name="engine")
+def engine_fixture(tmp_path):
+    # File-backed SQLite; NullPool since TestClient may use a new event loop per request
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'test.db'}",
+        poolclass=NullPool,
     )
-    SQLModel.metadata.create_all(engine)
-    with Session(engine) as session:
-        yield session
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+    asyncio.run(create_tables())
+    yield engine
+    asyncio.run(engine.dispose())
 
 
 @pytest.fixture(name="client")
-def client_fixture(session: Session):
-    def get_session_override():
-        return session
+def client_fixture(engine):
+    async def get_session_override():
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
 
     app.dependency_overrides[get_session] = get_session_override
     client = TestClient(app)
@@ -76,7 +86,7 @@ def test_list_tasks(client: TestClient, auth_headers: dict):
 
     response = client.get("/api/tasks", headers=auth_headers)
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()["items"]
     assert len(data) == 2
 
 
@@ -159,12 +169,64 @@ def test_filter_completed_tasks(client: TestClient, auth_headers: dict):
 
     response = client.get("/api/tasks?completed=true", headers=auth_headers)
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()["items"]
     assert len(data) == 1
     assert data[0]["title"] == "Completed Task"
 
     response = client.get("/api/tasks?completed=false", headers=auth_headers)
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()["items"]
     assert len(data) == 1
     assert data[0]["title"] == "Pending Task"
+
+
+def test_list_tasks_pagination(client: TestClient, auth_headers: dict):
+    for i in range(5):
+        client.post(
+            "/api/tasks",
+            json={"title": f"Task {i}"},
+            headers=auth_headers
+        )
+
+    titles = []
+    params = {"limit": 2}
+    while True:
+        response = client.get("/api/tasks", params=params, headers=auth_headers)
+        assert response.status_code == 200
+        page = response.json()
+        titles.extend(task["title"] for task in page["items"])
+        if page["next_cursor"] is None:
+            break
+        params = {"limit": 2, "cursor": page["next_cursor"]}
+
+    assert titles == [f"Task {i}" for i in reversed(range(5))]
+
+    response = client.get("/api/tasks?cursor=bogus", headers=auth_headers)
+    assert response.status_code == 400
+
+
+def test_task_etags(client: TestClient, auth_headers: dict):
+    create_response = client.post(
+        "/api/tasks",
+        json={"title": "Task"},
+        headers=auth_headers
+    )
+    task_id = create_response.json()["id"]
+    urls = (f"/api/tasks/{task_id}", "/api/tasks")
+
+    etags = {}
+    for url in urls:
+        response = client.get(url, headers=auth_headers)
+        assert response.status_code == 200
+        etags[url] = response.headers["etag"]
+
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etags[url]})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    # Any change to the task invalidates both tags
+    client.patch(f"/api/tasks/{task_id}/complete", headers=auth_headers)
+    for url in urls:
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etags[url]})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etags[url]